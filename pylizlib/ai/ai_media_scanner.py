@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pylizlib.ai.domain import AiScanResult, AiScanTool, AiToolScanner
 from pylizlib.ai.providers import EasyOcrProvider, JoyTagProvider, NudeNetProvider
+from pylizlib.core.log.pylizLogger import logger
 from pylizlib.media.lizmedia import LizMedia
 from pylizlib.media.util.source import resolve_media_source
 
@@ -25,6 +28,54 @@ class AiMediaScanner:
         active_providers = providers if providers is not None else [JoyTagProvider(), NudeNetProvider(), EasyOcrProvider()]
         self._providers = {provider.tool: provider for provider in active_providers}
 
+    def warm_up(self, tools: list[str] | None = None, *, background: bool = False) -> threading.Thread | None:
+        """
+        Loads the models of the given tools ahead of the first scan, so the first real request
+        does not pay the model load.
+
+        Args:
+            tools: Tool identifiers to warm up. Defaults to every configured provider.
+            background: If True, loads the models on a daemon thread and returns immediately.
+
+        Returns:
+            The warm-up thread when background is True, otherwise None.
+
+        Raises:
+            ValueError: If an unsupported or unconfigured tool is requested.
+            ImportError: If a provider's optional dependencies are missing (foreground only).
+        """
+        if tools is None:
+            providers = list(self._providers.values())
+        else:
+            providers = []
+            for tool in AiScanTool.normalize_many(tools):
+                provider = self._providers.get(tool)
+                if provider is None:
+                    raise ValueError(f"No provider configured for AI scan tool '{tool.value}'.")
+                providers.append(provider)
+
+        if not background:
+            self._warm_up_providers(providers)
+            return None
+
+        def run() -> None:
+            try:
+                self._warm_up_providers(providers)
+            except Exception as exc:
+                logger.warning(f"AI model warm-up failed: {exc}")
+
+        thread = threading.Thread(target=run, name="pyliz-ai-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _warm_up_providers(providers: list[AiToolScanner]) -> None:
+        """Calls warm_up() on each provider that supports it."""
+        for provider in providers:
+            warm_up = getattr(provider, "warm_up", None)
+            if warm_up is not None:
+                warm_up()
+
     def scan(
         self,
         *,
@@ -76,6 +127,39 @@ class AiMediaScanner:
                 source.path.unlink(missing_ok=True)
             raise
 
+    def scan_many(
+        self,
+        *,
+        tools: list[str],
+        media_paths: list[str | Path],
+        max_workers: int | None = None,
+    ) -> list[LizMedia]:
+        """
+        Performs the requested AI scans on many media files concurrently.
+
+        Scans are submitted to a thread pool so model inference on one file can overlap
+        with decoding and I/O of the others, instead of running strictly one after another.
+
+        Args:
+            tools: List of tool identifiers (e.g. ['tags', 'nsfw', 'ocr']).
+            media_paths: Local filesystem paths of the media files to scan.
+            max_workers: Maximum number of concurrent scans. Defaults to min(8, len(media_paths)).
+
+        Returns:
+            The scanned LizMedia objects, in the same order as media_paths.
+
+        Raises:
+            ValueError: If an unsupported tool is requested.
+            FileNotFoundError: If one of the media paths does not exist.
+        """
+        if not media_paths:
+            return []
+
+        AiScanTool.normalize_many(tools)
+        workers = max_workers or min(8, len(media_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda path: self.scan(tools=tools, media_path=path), media_paths))
+
     def scan_media(
         self,
         *,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import TYPE_CHECKING, Protocol
 
@@ -27,17 +27,8 @@ class AiScanTool(str, Enum):
         Handles normalization and common aliases (e.g. 'joytag' -> TAGS).
         """
         normalized = value.strip().upper().replace("_", "-")
-        aliases = {
-            "TAGS": cls.TAGS,
-            "TAG": cls.TAGS,
-            "JOYTAG": cls.TAGS,
-            "TAGS-JOYTAG": cls.TAGS,
-            "TAG-JOYTAG": cls.TAGS,
-            "NSFW": cls.NSFW,
-            "OCR": cls.OCR,
-        }
         try:
-            return aliases[normalized]
+            return _TOOL_ALIASES[normalized]
         except KeyError as exc:
             allowed = ", ".join(tool.value for tool in cls)
             raise ValueError(f"Unsupported AI scan tool '{value}'. Allowed values: {allowed}") from exc
@@ -61,6 +52,17 @@ class AiScanTool(str, Enum):
         return normalized
 
 
+_TOOL_ALIASES: dict[str, AiScanTool] = {
+    "TAGS": AiScanTool.TAGS,
+    "TAG": AiScanTool.TAGS,
+    "JOYTAG": AiScanTool.TAGS,
+    "TAGS-JOYTAG": AiScanTool.TAGS,
+    "TAG-JOYTAG": AiScanTool.TAGS,
+    "NSFW": AiScanTool.NSFW,
+    "OCR": AiScanTool.OCR,
+}
+
+
 @dataclass(slots=True)
 class AiScanResult:
     """
@@ -74,17 +76,17 @@ class AiScanResult:
 
     def merge(self, other: "AiScanResult") -> "AiScanResult":
         """Merges another scan result into this one, overwriting non-None values."""
-        if other.tags is not None:
-            self.tags = other.tags
-        if other.nsfw is not None:
-            self.nsfw = other.nsfw
-        if other.ocr_text is not None:
-            self.ocr_text = other.ocr_text
-        if other.ocr_detected is not None:
-            self.ocr_detected = other.ocr_detected
+        for name in _SCAN_RESULT_FIELDS:
+            value = getattr(other, name)
+            if value is not None:
+                setattr(self, name, value)
         return self
 
 
+# Field names resolved once so merge() stays in sync with the dataclass schema.
+_SCAN_RESULT_FIELDS = tuple(f.name for f in fields(AiScanResult))
+
+
 class AiToolScanner(Protocol):
     """
     Protocol definition for an AI analysis provider plugin.
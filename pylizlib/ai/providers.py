@@ -4,19 +4,19 @@ import importlib.util
 import os
 import sys
 import tempfile
+import threading
 import time
 import urllib.request
 import warnings
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from PIL import Image
 
 from pylizlib.ai.domain import AiScanResult, AiScanTool
 from pylizlib.ai.utils import unique_preserving_order
 from pylizlib.core.log.pylizLogger import logger
-from pylizlib.media.compute.video_sampling import sample_video_frames
 
 if TYPE_CHECKING:
     from pylizlib.media.lizmedia import LizMedia
@@ -24,18 +24,69 @@ if TYPE_CHECKING:
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=UserWarning)
 
-_IMAGE_EXTENSIONS = {"jpg", "jpeg", "png", "webp", "bmp", "gif", "tiff", "tif"}
-_VIDEO_EXTENSIONS = {"mp4", "mov", "avi", "mkv", "webm"}
+_IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "webp", "bmp", "gif", "tiff", "tif"})
+_VIDEO_EXTENSIONS = frozenset({"mp4", "mov", "avi", "mkv", "webm"})
+_SUPPORTED_EXTENSIONS = _IMAGE_EXTENSIONS | _VIDEO_EXTENSIONS
 _DEFAULT_MODEL_DIR = os.getenv("PYLIZ_AI_MODELS_PATH", os.path.expanduser("~/Documents/models"))
 
 
+def _sample_video_frames(video_path: Path, max_frames: int):
+    """
+    Samples frames from a video, importing the OpenCV-based sampler only when a video is scanned.
+    Keeps `import pylizlib.ai` from paying the cv2 import cost for image-only workloads.
+    """
+    from pylizlib.media.compute.video_sampling import sample_video_frames
+
+    return sample_video_frames(video_path, max_frames=max_frames)
+
+
 class BaseAiProvider(ABC):
     """
     Base class for AI-based media analysis providers.
+
+    Loaded models are kept in a class-level cache shared by every provider instance with the
+    same configuration, so creating a new scanner does not load the weights again.
     """
 
     tool: AiScanTool
 
+    _runtime_cache: ClassVar[dict[tuple, Any]] = {}
+    # One lock per cache key, so loading one model does not block loads of the others
+    _runtime_locks: ClassVar[dict[tuple, threading.Lock]] = {}
+    _runtime_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _get_cached_runtime(cls, key: tuple, loader):
+        """
+        Returns the runtime cached under key, loading it once with loader when missing.
+
+        Only callers waiting for the same key are serialized; different models load concurrently.
+
+        Args:
+            key: Hashable cache key describing the provider configuration.
+            loader: Zero-argument callable that loads the runtime.
+
+        Returns:
+            The cached runtime object.
+        """
+        runtime = cls._runtime_cache.get(key)
+        if runtime is not None:
+            return runtime
+        with cls._runtime_lock:
+            key_lock = cls._runtime_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            runtime = cls._runtime_cache.get(key)
+            if runtime is None:
+                runtime = loader()
+                cls._runtime_cache[key] = runtime
+        return runtime
+
+    def warm_up(self) -> None:
+        """
+        Loads the provider runtime ahead of the first scan so it does not pay the model load.
+        Providers without a runtime to load keep this no-op.
+        """
+
     @abstractmethod
     def scan(self, media: "LizMedia") -> AiScanResult:
         """
@@ -91,7 +142,7 @@ class JoyTagProvider(BaseAiProvider):
         Returns:
             AiScanResult with predicted tags. Returns empty list if media type is unsupported.
         """
-        if media.extension.lstrip(".") not in _IMAGE_EXTENSIONS | _VIDEO_EXTENSIONS:
+        if media.extension.lstrip(".") not in _SUPPORTED_EXTENSIONS:
             return AiScanResult(tags=[])
 
         model, tag_list, device, tvf, torch = self._get_runtime()
@@ -102,14 +153,18 @@ class JoyTagProvider(BaseAiProvider):
                 image = image_file.convert("RGB")
                 predicted_tags.extend(self._predict_from_image(image, model, tag_list, device, tvf, torch))
         elif media.is_video:
-            for frame in sample_video_frames(media.path, max_frames=self.video_sample_frames):
-                image = Image.fromarray(frame)
-                predicted_tags.extend(self._predict_from_image(image, model, tag_list, device, tvf, torch))
+            frames = [Image.fromarray(frame) for frame in _sample_video_frames(media.path, max_frames=self.video_sample_frames)]
+            if frames:
+                predicted_tags.extend(self._predict_from_images(frames, model, tag_list, device, tvf, torch))
         else:
             return AiScanResult(tags=[])
 
         return AiScanResult(tags=unique_preserving_order(predicted_tags))
 
+    def warm_up(self) -> None:
+        """Loads the model into the shared runtime cache."""
+        self._get_runtime()
+
     def _get_runtime(self):
         """
         Loads and initializes Torch, the JoyTag model, and its dependencies.
@@ -124,14 +179,31 @@ class JoyTagProvider(BaseAiProvider):
         if self._model is not None:
             return self._model, self._tag_list, self._device, self._tvf, self._torch
 
+        runtime = self._get_cached_runtime(("joytag", self.model_dir), self._load_runtime)
+        self._model, self._tag_list, self._device, self._tvf, self._torch = runtime
+        return runtime
+
+    def _load_runtime(self):
+        """
+        Imports the optional dependencies and loads the JoyTag model onto the best available device.
+
+        Returns:
+            A tuple of (model, tag_list, device, torchvision_functional, torch_module).
+        """
         try:
             import torch
             import torchvision.transforms.functional as tvf
             from huggingface_hub import snapshot_download
+            from huggingface_hub.errors import LocalEntryNotFoundError
         except ImportError as exc:
             raise ImportError("JoyTag scanning requires the optional AI dependencies. Install the 'ai' extra to enable TAGS scans.") from exc
 
-        model_path = snapshot_download(repo_id="fancyfeast/joytag", cache_dir=self.model_dir)
+        try:
+            # Resolve from the local cache first, so warm starts make no Hub round-trips
+            model_path = snapshot_download(repo_id="fancyfeast/joytag", cache_dir=self.model_dir, local_files_only=True)
+        except LocalEntryNotFoundError as exc:
+            logger.debug(f"JoyTag model not found in local cache, downloading it: {exc}")
+            model_path = snapshot_download(repo_id="fancyfeast/joytag", cache_dir=self.model_dir)
         py_file_path = os.path.join(model_path, "Models.py")
         if not os.path.exists(py_file_path):
             url = "https://huggingface.co/spaces/fancyfeast/joytag/resolve/main/Models.py"
@@ -157,13 +229,7 @@ class JoyTagProvider(BaseAiProvider):
         model = vision_model.load_model(model_path)
         model.eval()
         model = model.to(device)
-
-        self._model = model
-        self._tag_list = tag_list
-        self._device = device
-        self._tvf = tvf
-        self._torch = torch
-        return self._model, self._tag_list, self._device, self._tvf, self._torch
+        return model, tag_list, device, tvf, torch
 
     def _predict_from_image(
         self,
@@ -188,20 +254,48 @@ class JoyTagProvider(BaseAiProvider):
         Returns:
             List of tags exceeding the confidence threshold.
         """
+        return self._predict_from_images([image], model, tag_list, device, tvf, torch)
+
+    def _predict_from_images(
+        self,
+        images: list,
+        model,
+        tag_list,
+        device,
+        tvf,
+        torch,
+    ) -> list[str]:
+        """
+        Runs model inference on several PIL Images in a single batched forward pass.
+
+        Args:
+            images: Non-empty list of PIL Image objects.
+            model: Loaded JoyTag model.
+            tag_list: List of supported tag names.
+            device: Torch device.
+            tvf: torchvision.transforms.functional module.
+            torch: torch module.
+
+        Returns:
+            Tags exceeding the confidence threshold, image by image in input order.
+        """
         resample_mode = getattr(getattr(Image, "Resampling", Image), "BILINEAR")
 
-        image = image.resize((448, 448), resample=resample_mode)
-        image_tensor = tvf.to_tensor(image)
-        image_tensor = tvf.normalize(
-            image_tensor,
-            [0.48145466, 0.4578275, 0.40821073],
-            [0.26862954, 0.26130258, 0.27577711],
-        )
-        image_tensor = image_tensor.unsqueeze(0).to(device)
+        image_tensors = []
+        for image in images:
+            image = image.resize((448, 448), resample=resample_mode)
+            image_tensor = tvf.to_tensor(image)
+            image_tensor = tvf.normalize(
+                image_tensor,
+                [0.48145466, 0.4578275, 0.40821073],
+                [0.26862954, 0.26130258, 0.27577711],
+            )
+            image_tensors.append(image_tensor)
+        batch_tensor = torch.stack(image_tensors).to(device)
 
         start_time = time.time()
         with torch.no_grad():
-            batch = {"image": image_tensor}
+            batch = {"image": batch_tensor}
             output = model(batch)
 
             if isinstance(output, dict):
@@ -218,12 +312,15 @@ class JoyTagProvider(BaseAiProvider):
             else:
                 preds = output
 
-            if preds.dim() > 1:
-                preds = preds.squeeze(0)
+            if preds.dim() == 1:
+                preds = preds.unsqueeze(0)
             preds = torch.sigmoid(preds)
 
-        logger.debug(f"JoyTag inference completed in {round(time.time() - start_time, 2)}s for {len(tag_list)} tags.")
-        return [tag_list[i] for i, prediction in enumerate(preds) if prediction > self.confidence_threshold]
+        logger.debug(f"JoyTag inference completed in {round(time.time() - start_time, 2)}s for {len(images)} image(s) and {len(tag_list)} tags.")
+        tags: list[str] = []
+        for row in preds:
+            tags.extend(tag_list[i] for i in torch.nonzero(row > self.confidence_threshold).flatten().tolist())
+        return tags
 
 
 class EasyOcrProvider(BaseAiProvider):
@@ -268,7 +365,7 @@ class EasyOcrProvider(BaseAiProvider):
         if media.is_image:
             texts.extend(self._extract_texts(reader.readtext(str(media.path))))
         elif media.is_video:
-            for frame in sample_video_frames(media.path, max_frames=self.video_sample_frames):
+            for frame in _sample_video_frames(media.path, max_frames=self.video_sample_frames):
                 texts.extend(self._extract_texts(reader.readtext(frame)))
         else:
             return AiScanResult(ocr_text=[], ocr_detected=False)
@@ -276,6 +373,10 @@ class EasyOcrProvider(BaseAiProvider):
         normalized_texts = unique_preserving_order(texts)
         return AiScanResult(ocr_text=normalized_texts, ocr_detected=bool(normalized_texts))
 
+    def warm_up(self) -> None:
+        """Loads the model into the shared runtime cache."""
+        self._get_reader()
+
     def _get_reader(self):
         """
         Loads and initializes EasyOCR.
@@ -289,19 +390,23 @@ class EasyOcrProvider(BaseAiProvider):
         if self._reader is not None:
             return self._reader
 
+        self._reader = self._get_cached_runtime(("easyocr", tuple(self.languages), self.model_dir), self._load_reader)
+        return self._reader
+
+    def _load_reader(self):
+        """Imports EasyOCR and builds a reader for the configured languages."""
         try:
             import easyocr
             import torch
         except ImportError as exc:
             raise ImportError("OCR scanning requires the optional AI dependencies. Install the 'ai' extra to enable OCR scans.") from exc
 
-        self._reader = easyocr.Reader(
+        return easyocr.Reader(
             self.languages,
             gpu=torch.cuda.is_available(),
             model_storage_directory=self.model_dir,
             verbose=False,
         )
-        return self._reader
 
     @staticmethod
     def _extract_texts(results: list) -> list[str]:
@@ -338,6 +443,9 @@ class NudeNetProvider(BaseAiProvider):
         "ANUS_EXPOSED",
     }
 
+    # Frames per detect_batch call (NudeNet's own default batch size); small chunks keep the early exit
+    FRAME_BATCH_SIZE = 4
+
     def __init__(self, inference_threshold: float = 0.5, video_sample_frames: int = 5):
         """
         Initializes the NudeNet provider.
@@ -365,12 +473,14 @@ class NudeNetProvider(BaseAiProvider):
         if media.is_image:
             return AiScanResult(nsfw=self._detect_image(detector, media.path))
         if media.is_video:
-            for frame in sample_video_frames(media.path, max_frames=self.video_sample_frames):
-                if self._detect_frame(detector, frame):
-                    return AiScanResult(nsfw=True)
-            return AiScanResult(nsfw=False)
+            frames = _sample_video_frames(media.path, max_frames=self.video_sample_frames)
+            return AiScanResult(nsfw=self._detect_frames(detector, frames))
         return AiScanResult(nsfw=False)
 
+    def warm_up(self) -> None:
+        """Loads the model into the shared runtime cache."""
+        self._get_detector()
+
     def _get_detector(self):
         """
         Loads and initializes NudeNet NudeDetector.
@@ -384,18 +494,53 @@ class NudeNetProvider(BaseAiProvider):
         if self._detector is not None:
             return self._detector
 
+        self._detector = self._get_cached_runtime(("nudenet",), self._load_detector)
+        return self._detector
+
+    @staticmethod
+    def _load_detector():
+        """Imports NudeNet and builds a NudeDetector."""
         try:
             from nudenet import NudeDetector
         except ImportError as exc:
             raise ImportError("NSFW scanning requires the optional AI dependencies. Install the 'ai' extra to enable NSFW scans.") from exc
 
-        self._detector = NudeDetector()
-        return self._detector
+        return NudeDetector()
 
     def _detect_image(self, detector, image_path: Path) -> bool:
         """Runs detector on a specific image path."""
         return self._contains_explicit_detection(detector.detect(str(image_path)))
 
+    def _detect_frames(self, detector, frames: list) -> bool:
+        """
+        Runs detection over several frames, in small batched calls when the
+        installed NudeNet exposes ``detect_batch``.
+
+        Frames are sent in chunks of ``FRAME_BATCH_SIZE`` and scanning stops at the
+        first chunk with an explicit detection, like the per-frame loop does.
+
+        Args:
+            detector: The NudeDetector instance.
+            frames: Raw RGB frames sampled from a video.
+
+        Returns:
+            True if any frame contains explicit content.
+        """
+        if not hasattr(detector, "detect_batch"):
+            return any(self._detect_frame(detector, frame) for frame in frames)
+
+        with tempfile.TemporaryDirectory(prefix="pyliz_nudenet_") as temp_dir:
+            for start in range(0, len(frames), self.FRAME_BATCH_SIZE):
+                frame_paths = []
+                for index, frame in enumerate(frames[start : start + self.FRAME_BATCH_SIZE], start):
+                    frame_path = Path(temp_dir) / f"frame_{index}.png"
+                    Image.fromarray(frame).save(frame_path)
+                    frame_paths.append(str(frame_path))
+                batch_detections = detector.detect_batch(frame_paths)
+                if any(self._contains_explicit_detection(detections) for detections in batch_detections):
+                    return True
+        return False
+
     def _detect_frame(self, detector, frame) -> bool:
         """Saves a raw frame to temp and runs detection."""
         with tempfile.NamedTemporaryFile(suffix=".png", delete=True) as handle:
@@ -54,7 +54,7 @@ class PylizApp:
         self.name = app_name
         self.version = app_version
         self.author = author
-        self.__folders: list[PylizDirFolder] = []
+        self.__folders: dict[str, PylizDirFolder] = {}
         self.__ini: IniManager | None = None
         self.__ini_path: str | None = None
         self.__ini_initialized = False
@@ -64,14 +64,6 @@ class PylizApp:
 
         return self.path
 
-    def _get_folder_index(self, key: str) -> int | None:
-        """Return the index of a tracked folder by key, if present."""
-
-        for index, folder in enumerate(self.__folders):
-            if folder.key == key:
-                return index
-        return None
-
     def add_folder(self, key: str, folder_name: str) -> str:
         """Create or update a tracked subfolder inside the app directory."""
 
@@ -80,13 +72,7 @@ class PylizApp:
         pathutils.check_path(folder_path, True)
         pathutils.check_path_dir(folder_path)
 
-        folder = PylizDirFolder(key, folder_name, folder_path)
-        existing_index = self._get_folder_index(key)
-        if existing_index is None:
-            self.__folders.append(folder)
-        else:
-            self.__folders[existing_index] = folder
-
+        self.__folders[key] = PylizDirFolder(key, folder_name, folder_path)
         return folder_path
 
     def add_template_folder(
@@ -123,10 +109,8 @@ class PylizApp:
     def get_folder_path(self, key: str) -> str | None:
         """Return the tracked folder path for a given key."""
 
-        for folder in self.__folders:
-            if folder.key == key:
-                return folder.path
-        return None
+        folder = self.__folders.get(key)
+        return folder.path if folder is not None else None
 
     def get_folder_template_path(
         self,
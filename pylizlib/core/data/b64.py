@@ -0,0 +1,34 @@
+"""Base64 helpers backed by ``pybase64`` when it is installed (``pip install pylizlib[perf]``)."""
+
+import base64
+
+try:
+    import pybase64 as _pybase64
+except ImportError:
+    _pybase64 = None
+
+
+def b64encode(data: bytes | bytearray | memoryview) -> bytes:
+    """Encode bytes to standard Base64, using the SIMD ``pybase64`` encoder when available.
+
+    :param data: Raw bytes to encode.
+    :return: Base64 encoded bytes.
+    """
+
+    if _pybase64 is not None:
+        return _pybase64.b64encode(data)
+    return base64.b64encode(data)
+
+
+def b64decode(data: str | bytes, *, validate: bool = True) -> bytes:
+    """Decode standard Base64, validating the alphabet in the same pass by default.
+
+    :param data: Base64 text or bytes.
+    :param validate: Reject characters outside the Base64 alphabet instead of discarding them.
+    :return: Decoded bytes.
+    :raises ValueError: When the input is not valid Base64 (``binascii.Error`` is a subclass).
+    """
+
+    if _pybase64 is not None:
+        return _pybase64.b64decode(data, validate=validate)
+    return base64.b64decode(data, validate=validate)
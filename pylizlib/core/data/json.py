@@ -1,8 +1,48 @@
-"""JSON utility helpers."""
+"""JSON utility helpers.
+
+``orjson`` is used when it is installed (``pip install pylizlib[perf]``); otherwise the stdlib
+``json`` module is used with the same behaviour.
+"""
 
 import json
 from json import JSONDecodeError
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Parse a JSON document, using ``orjson`` when it is installed.
+
+    :param data: JSON text or UTF-8 encoded bytes.
+    :return: Decoded Python object.
+    :raises JSONDecodeError: When the input is not valid JSON.
+    """
+
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, default: Callable[[Any], Any] | None = None, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, using ``orjson`` when it is installed.
+
+    ``orjson`` encodes datetimes, enums and dataclasses natively, so ``default`` is only
+    consulted for other types (and for every unsupported type on the stdlib fallback).
+
+    :param obj: Object to serialize.
+    :param default: Converter for objects the encoder does not support.
+    :param indent: Pretty-print with a two-space indent.
+    :return: UTF-8 encoded JSON document.
+    :raises TypeError: When an object cannot be serialized.
+    """
+
+    if _orjson is not None:
+        return _orjson.dumps(obj, default=default, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, default=default, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
 
 
 class JsonUtils:
@@ -13,11 +53,31 @@ class JsonUtils:
         """Return ``True`` when the input string contains valid JSON."""
 
         try:
-            json.loads(json_str)
+            loads(json_str)
             return True
         except (TypeError, JSONDecodeError):
             return False
 
+    @staticmethod
+    def parse_object(json_str: str | bytes, keys: list[str] | None = None) -> dict[str, Any] | None:
+        """Parse a JSON object string once, validating it and its keys in the same pass.
+
+        :param json_str: JSON string (or UTF-8 bytes) to parse.
+        :param keys: Optional keys that must exist at top-level.
+        :return: The decoded object, or ``None`` when the input is not valid JSON,
+            is not an object, or misses one of ``keys``.
+        """
+
+        try:
+            json_obj: Any = loads(json_str)
+        except (TypeError, JSONDecodeError):
+            return None
+        if not isinstance(json_obj, dict):
+            return None
+        if keys and not json_obj.keys() >= set(keys):
+            return None
+        return json_obj
+
     @staticmethod
     def has_keys(json_str: str, keys: list[str]) -> bool:
         """Check whether a JSON object string contains all expected keys.
@@ -27,16 +87,7 @@ class JsonUtils:
         :return: ``True`` only when parsed JSON is an object containing all keys.
         """
 
-        try:
-            json_obj: Any = json.loads(json_str)
-            if not isinstance(json_obj, dict):
-                return False
-            for key in keys:
-                if key not in json_obj:
-                    return False
-            return True
-        except (TypeError, JSONDecodeError):
-            return False
+        return JsonUtils.parse_object(json_str, keys) is not None
 
     @staticmethod
     def clean_json_apici(json_string: str) -> str:
@@ -13,6 +13,8 @@ class Operation(Generic[T]):
     :param error: Optional error message.
     """
 
+    __slots__ = ("payload", "status", "error")
+
     def __init__(
         self,
         payload: Optional[T] = None,
@@ -23,6 +25,18 @@ class Operation(Generic[T]):
         self.status = status
         self.error = error
 
+    @classmethod
+    def ok(cls, payload: Optional[T] = None) -> "Operation[T]":
+        """Build a successful operation carrying ``payload``."""
+
+        return cls(payload=payload, status=True)
+
+    @classmethod
+    def fail(cls, error: Optional[str] = None) -> "Operation[T]":
+        """Build a failed operation carrying ``error``."""
+
+        return cls(status=False, error=error)
+
     def is_op_ok(self) -> bool:
         """Return operation success state."""
 
@@ -1,12 +1,19 @@
 """HTTP/network request helpers and response wrappers."""
 
+import asyncio
 import socket
+import time
 from enum import Enum
+from functools import cached_property
+from json import JSONDecodeError
 from typing import Mapping
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.models import Response
+from urllib3.util.retry import Retry
 
+from pylizlib.core.data.json import loads
 from pylizlib.core.log.pylizLogger import logger
 
 
@@ -32,22 +39,39 @@ class NetResponse:
         """Initialize a response wrapper and derive helper fields."""
 
         self.has_json_header = None
-        self.json = None
         self.response = response
         self.hasResponse = self.response is not None
         if self.hasResponse:
             self.code = self.response.status_code
-            self.text: str = self.response.text
         else:
             self.code = None
         self.type = response_type
         self.exception = exception
         if self.hasResponse:
             self.has_json_header = "application/json" in self.response.headers.get("Content-Type", "")
-            if self.has_json_header:
-                self.json = self.response.json()
         self.__log()
 
+    @cached_property
+    def text(self) -> str | None:
+        """Return the decoded response body, computed on first access."""
+
+        return self.response.text if self.hasResponse else None
+
+    @cached_property
+    def json(self):
+        """Return the parsed JSON body, or ``None`` without a JSON header or when the body is invalid.
+
+        Parsing is deferred to the first access, so callers that only check the status code never pay for it.
+        """
+
+        if not self.has_json_header:
+            return None
+        try:
+            return loads(self.response.content)
+        except JSONDecodeError as e:
+            logger.warning(f"Invalid JSON body in response with JSON content type: {e}")
+            return None
+
     def __log(self) -> None:
         """Emit internal diagnostic log for the response wrapper."""
 
@@ -83,12 +107,41 @@ class NetResponse:
 
 HEADER_ONLY_CONTENT_JSON = {"Content-Type": "application/json"}
 
+_POOL_SIZE = 32
+_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False)
+
+
+def _build_session(max_retries: Retry | int = _RETRY) -> requests.Session:
+    """Create a session with a pooled adapter that retries transient gateway errors.
+
+    ``raise_on_status`` is disabled so an exhausted retry still yields the last response
+    (reported as ``NetResponseType.ERROR``) instead of a ``RetryError``.
+    Pass ``max_retries=0`` for a pooled session that never retries.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=max_retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _build_session()
+# Reachability probes must answer fast: a retrying adapter would turn one 503 or timeout into four.
+_probe_session = _build_session(max_retries=0)
+
+
+def get_session() -> requests.Session:
+    """Return the shared session reused by the request helpers (keeps connections alive)."""
+
+    return _session
+
 
 def test_with_head(url: str) -> bool:
     """Return ``True`` when a HEAD request gets a non-error status code."""
 
     try:
-        response = requests.head(url, timeout=5)
+        response = _probe_session.head(url, timeout=5)
         return response.status_code < 400
     except requests.RequestException as e:
         logger.error("Error while testing URL: " + url + " - " + str(e))
@@ -99,7 +152,7 @@ def is_endpoint_reachable(url: str) -> bool:
     """Return ``True`` when a GET request responds with HTTP 200."""
 
     try:
-        response = requests.get(url, timeout=5)
+        response = _probe_session.get(url, timeout=5)
         if response.status_code == 200:
             return True
         else:
@@ -109,19 +162,33 @@ def is_endpoint_reachable(url: str) -> bool:
         return False
 
 
-def is_internet_available() -> bool:
-    """Check internet connectivity by opening a socket to a public DNS host."""
+_INTERNET_CHECK_TTL = 5.0
+_internet_check: tuple[float, bool] | None = None
+
+
+def is_internet_available(ttl: float = _INTERNET_CHECK_TTL) -> bool:
+    """Check internet connectivity by opening a socket to a public DNS host.
+
+    The result is cached for ``ttl`` seconds so batch callers do not pay a round-trip per check;
+    pass ``ttl=0`` to force a fresh probe.
+    """
+
+    global _internet_check
+    now = time.monotonic()
+    if ttl > 0 and _internet_check is not None and now - _internet_check[0] < ttl:
+        return _internet_check[1]
 
     host = "8.8.8.8"
     port = 53
     timeout = 3
     try:
-        socket.setdefaulttimeout(timeout)
         # Utilizza un blocco `with` per gestire automaticamente il socket
-        with socket.create_connection((host, port)):
-            return True
+        with socket.create_connection((host, port), timeout=timeout):
+            available = True
     except OSError:
-        return False
+        available = False
+    _internet_check = (now, available)
+    return available
 
 
 def exec_get(
@@ -133,7 +200,7 @@ def exec_get(
 
     try:
         getattr(logger, "trace", logger.debug)("Executing GET request on URL: " + url)
-        response = requests.get(url, allow_redirects=True, headers=headers, timeout=sec_timeout)
+        response = _session.get(url, allow_redirects=True, headers=headers, timeout=sec_timeout)
         if response.status_code == 200:
             return NetResponse(response, NetResponseType.OK200)
         else:
@@ -151,12 +218,17 @@ def exec_post(
     payload,
     headers: Mapping[str, str | bytes | None] | None = None,
     verify_bool: bool = False,
+    sec_timeout: float | tuple[float, float] | None = None,
 ) -> NetResponse:
-    """Execute an HTTP POST request and return a standardized ``NetResponse``."""
+    """Execute an HTTP POST request and return a standardized ``NetResponse``.
+
+    ``sec_timeout`` follows ``requests`` semantics: a single value or a ``(connect, read)`` tuple.
+    By default no timeout is applied, so slow endpoints are waited on indefinitely.
+    """
 
     try:
         getattr(logger, "trace", logger.debug)("Executing POST request on URL: " + url)
-        response = requests.post(url, json=payload, verify=verify_bool, allow_redirects=True, headers=headers)
+        response = _session.post(url, json=payload, verify=verify_bool, allow_redirects=True, headers=headers, timeout=sec_timeout)
         if response.status_code == 200:
             return NetResponse(response, NetResponseType.OK200)
         else:
@@ -169,6 +241,34 @@ def exec_post(
         return NetResponse(None, NetResponseType.REQUEST_ERROR, e)
 
 
+async def exec_get_async(
+    url: str,
+    headers: Mapping[str, str | bytes | None] | None = None,
+    sec_timeout: int | None = 10,
+) -> NetResponse:
+    """Awaitable ``exec_get``: runs the request in a worker thread on the shared pooled session.
+
+    Lets callers overlap many requests with ``asyncio.gather`` without blocking the event loop.
+    """
+
+    return await asyncio.to_thread(exec_get, url, headers, sec_timeout)
+
+
+async def exec_post_async(
+    url: str,
+    payload,
+    headers: Mapping[str, str | bytes | None] | None = None,
+    verify_bool: bool = False,
+    sec_timeout: float | tuple[float, float] | None = None,
+) -> NetResponse:
+    """Awaitable ``exec_post``: runs the request in a worker thread on the shared pooled session.
+
+    Concurrency is bounded by the default executor and the session pool size.
+    """
+
+    return await asyncio.to_thread(exec_post, url, payload, headers, verify_bool, sec_timeout)
+
+
 def get_file_size_byte(url: str, exception_on_fail: bool = False) -> int:
     """Return file size in bytes from the ``content-length`` header.
 
@@ -178,7 +278,7 @@ def get_file_size_byte(url: str, exception_on_fail: bool = False) -> int:
     """
 
     try:
-        response = requests.head(url, timeout=5, allow_redirects=True)
+        response = _probe_session.head(url, timeout=5, allow_redirects=True)
         response.raise_for_status()
         file_size = response.headers.get("content-length", 0)
         if file_size is None:
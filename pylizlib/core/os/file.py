@@ -2,12 +2,12 @@ import json
 import os
 import platform
 from datetime import datetime
-
-import requests
+from email.utils import formatdate, parsedate_to_datetime
 
 from pylizlib.core.domain.operation import Operation
 from pylizlib.core.domain.os import FileType
 from pylizlib.core.log.pylizLogger import logger
+from pylizlib.core.network.req import get_session
 
 image_extensions = [
     ".png",
@@ -26,22 +26,48 @@ image_extensions = [
 video_extensions = [".mp4", ".avi", ".mov", ".mkv", ".flv", ".wmv", ".webm", ".3gp"]
 audio_extensions = [".mp3", ".wav", ".ogg", ".flac", ".wma", ".aac", ".m4a"]
 text_extensions = [".txt", ".doc", ".docx", ".pdf", ".odt", ".rtf", ".tex"]
+sidecar_extensions = [".xmp", ".xml", ".aae"]
+
+# Tabella estensione -> FileType: una sola lookup per file invece di scorrere ogni lista.
+# Le liste vengono inserite in ordine inverso cosi' a parita' di estensione vince la prima (come nella vecchia catena if/elif)
+_EXTENSION_FILE_TYPES: dict[str, FileType] = {
+    extension: file_type
+    for file_type, extensions in reversed(
+        (
+            (FileType.IMAGE, image_extensions),
+            (FileType.VIDEO, video_extensions),
+            (FileType.AUDIO, audio_extensions),
+            (FileType.TEXT, text_extensions),
+            (FileType.MEDIA_SIDECAR, sidecar_extensions),
+        )
+    )
+    for extension in extensions
+}
+_MEDIA_FILE_TYPES = frozenset((FileType.IMAGE, FileType.VIDEO, FileType.AUDIO))
+
+
+def get_extension_file_type(extension: str) -> FileType | None:
+    """
+    Returns the FileType associated with a file extension (e.g. ".jpg"), or None if unknown.
+    :param extension: extension including the leading dot
+    """
+    return _EXTENSION_FILE_TYPES.get(extension)
 
 
 def is_image_extension(extension: str) -> bool:
-    return extension in image_extensions
+    return _EXTENSION_FILE_TYPES.get(extension) is FileType.IMAGE
 
 
 def is_video_extension(extension: str) -> bool:
-    return extension in video_extensions
+    return _EXTENSION_FILE_TYPES.get(extension) is FileType.VIDEO
 
 
 def is_audio_extension(extension: str) -> bool:
-    return extension in audio_extensions
+    return _EXTENSION_FILE_TYPES.get(extension) is FileType.AUDIO
 
 
 def is_text_extension(extension: str) -> bool:
-    return extension in text_extensions
+    return _EXTENSION_FILE_TYPES.get(extension) is FileType.TEXT
 
 
 def is_image_file(path: str) -> bool:
@@ -61,31 +87,22 @@ def is_text_file(path: str) -> bool:
 
 
 def is_image_or_video_file(path: str) -> bool:
-    return is_image_file(path) or is_video_file(path)
+    return get_extension_file_type(os.path.splitext(path)[1]) in (FileType.IMAGE, FileType.VIDEO)
 
 
 def is_media_file(path: str) -> bool:
-    return is_image_file(path) or is_video_file(path) or is_audio_file(path)
+    return get_extension_file_type(os.path.splitext(path)[1]) in _MEDIA_FILE_TYPES
 
 
 def is_media_sidecar_file(path: str) -> bool:
-    sidecar_extensions = [".xmp", ".xml", ".aae"]
-    return os.path.splitext(path)[1] in sidecar_extensions
+    return get_extension_file_type(os.path.splitext(path)[1]) is FileType.MEDIA_SIDECAR
 
 
 def get_file_type(path: str) -> FileType:
-    if is_image_file(path):
-        return FileType.IMAGE
-    elif is_video_file(path):
-        return FileType.VIDEO
-    elif is_audio_file(path):
-        return FileType.AUDIO
-    elif is_text_file(path):
-        return FileType.TEXT
-    elif is_media_sidecar_file(path):
-        return FileType.MEDIA_SIDECAR
-    else:
+    file_type = get_extension_file_type(os.path.splitext(path)[1])
+    if file_type is None:
         raise ValueError("Unsupported file type")
+    return file_type
 
 
 def is_file_dup_in_dir(path: str, file_name: str) -> bool:
@@ -101,48 +118,107 @@ def get_file_c_date(path_to_file) -> datetime:
     last modified if that isn't possible.
     See http://stackoverflow.com/a/39501288/1709587 for explanation.
     """
+    return get_stat_c_date(os.stat(path_to_file))
+
+
+def get_stat_c_date(stat_result: os.stat_result) -> datetime:
+    """
+    Same rules as get_file_c_date, applied to an existing stat result so callers
+    that already hold one do not stat the file again.
+    :param stat_result: result of os.stat() on the file
+    """
+    return datetime.fromtimestamp(get_stat_c_timestamp(stat_result))
+
+
+def get_stat_c_timestamp(stat_result: os.stat_result) -> float:
+    """
+    POSIX timestamp behind get_stat_c_date, for callers that store many dates as plain numbers.
+    :param stat_result: result of os.stat() on the file
+    """
     if platform.system() == "Windows":
-        timestamp = os.path.getctime(path_to_file)
-    else:
-        stat = os.stat(path_to_file)
-        try:
-            timestamp = stat.st_birthtime
-        except AttributeError:
-            # We're probably on Linux. No easy way to get creation dates here,
-            # so we'll settle for when its content was last modified.
-            timestamp = stat.st_mtime
+        return stat_result.st_ctime
+    try:
+        return stat_result.st_birthtime
+    except AttributeError:
+        # We're probably on Linux. No easy way to get creation dates here,
+        # so we'll settle for when its content was last modified.
+        return stat_result.st_mtime
 
-    # Convert timestamp to datetime object
-    return datetime.fromtimestamp(timestamp)
 
+def _stamp_last_modified(path: str, last_modified: str | None):
+    """Set the mtime of ``path`` to the server's ``Last-Modified`` date, used later as ``If-Range`` validator."""
 
-def download_file(url: str, destinazione: str, on_progress: callable) -> Operation[None]:
+    if not last_modified:
+        return
     try:
-        response = requests.get(url, stream=True)
+        timestamp = parsedate_to_datetime(last_modified).timestamp()
+    except (TypeError, ValueError):
+        return
+    os.utime(path, (timestamp, timestamp))
+
+
+def download_file(url: str, destinazione: str, on_progress: callable, resume: bool = False) -> Operation[None]:
+    """Download ``url`` into ``destinazione`` reporting integer percentages to ``on_progress``.
+
+    When ``resume`` is ``True`` and ``destinazione`` already exists, only the missing bytes
+    are requested with an HTTP ``Range`` header; a file that is already complete is left untouched.
+    The request carries an ``If-Range`` validator built from the local file's mtime, which is set to the
+    server's ``Last-Modified`` after every download: if the remote file changed (or the local file
+    comes from elsewhere) the server answers with the full body and the local file is overwritten.
+    """
+
+    try:
+        session = get_session()
+        esistente = os.path.getsize(destinazione) if resume and os.path.isfile(destinazione) else 0
+        headers = None
+        if esistente > 0:
+            headers = {
+                "Range": f"bytes={esistente}-",
+                "If-Range": formatdate(os.path.getmtime(destinazione), usegmt=True),
+            }
+        response = session.get(url, stream=True, headers=headers)
+
+        if esistente > 0 and response.status_code == 416:
+            # Nessun byte oltre quelli già presenti: il file locale è completo se la dimensione coincide
+            totale_remoto = response.headers.get("content-range", "").rpartition("/")[2]
+            if totale_remoto == str(esistente):
+                getattr(logger, "trace", logger.debug)("File already downloaded, skipping.")
+                return Operation.ok()
+            esistente = 0
+            response = session.get(url, stream=True)
+
         response.raise_for_status()  # Verifica se la richiesta è andata a buon fine
 
-        # Ottieni la dimensione totale del file dal campo 'Content-Length' dell'header
-        totale = int(response.headers.get("content-length", 0))
+        # 206 = il server ha accettato il Range: si accoda al file parziale, altrimenti si riscrive da zero
+        riprendi = esistente > 0 and response.status_code == 206
+        scaricato = esistente if riprendi else 0
 
-        # Inizializza variabili per il calcolo della percentuale
-        scaricato = 0
+        # Ottieni la dimensione totale del file dal campo 'Content-Length' dell'header
+        totale = scaricato + int(response.headers.get("content-length") or 0)
         percentuale = 0
 
-        with open(destinazione, "wb") as file:
-            for chunk in response.iter_content(chunk_size=1024):
-                if chunk:  # Filtra fuori i chunk vuoti
-                    file.write(chunk)
-                    scaricato += len(chunk)
-
-                    # Calcola la nuova percentuale
-                    nuova_percentuale = int(scaricato * 100 / totale)
-                    if nuova_percentuale > percentuale:
-                        percentuale = nuova_percentuale
-                        on_progress(percentuale)
-        logger.trace("Download completed!")
-        return Operation(status=True)
+        try:
+            with open(destinazione, "ab" if riprendi else "wb") as file:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if chunk:  # Filtra fuori i chunk vuoti
+                        file.write(chunk)
+                        scaricato += len(chunk)
+
+                        # Calcola la nuova percentuale (solo se la dimensione totale è nota)
+                        if totale <= 0:
+                            continue
+                        nuova_percentuale = int(scaricato * 100 / totale)
+                        if nuova_percentuale > percentuale:
+                            percentuale = nuova_percentuale
+                            if on_progress is not None:
+                                on_progress(percentuale)
+        finally:
+            # Anche un download interrotto viene marcato, così un resume successivo può validarlo
+            _stamp_last_modified(destinazione, response.headers.get("last-modified"))
+        getattr(logger, "trace", logger.debug)("Download completed!")
+        return Operation.ok()
     except Exception as e:
-        return Operation(status=False, error=str(e))
+        return Operation.fail(str(e))
 
 
 def write_json_to_file(path, filename, content):
@@ -3,7 +3,7 @@ import random
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Callable, List, LiteralString, Optional
+from typing import Callable, Iterator, List, LiteralString, Optional
 
 from pylizlib.core.data import gen
 from pylizlib.core.log.pylizLogger import logger
@@ -251,7 +251,8 @@ def get_folders_from(directory, recursive: bool = False) -> list[LiteralString |
     """
     if recursive:
         return [os.path.join(root, d) for root, dirs, files in os.walk(directory) for d in dirs]
-    return [d for d in os.listdir(directory) if os.path.isdir(os.path.join(directory, d))]
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
 
 
 def get_files_from(
@@ -272,33 +273,40 @@ def get_files_from(
             for file in files:
                 db.append(os.path.join(root, file))
     else:
-        db = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
+        with os.scandir(directory) as entries:
+            db = [entry.name for entry in entries if entry.is_file()]
     if extension is not None:
         return [f for f in db if f.endswith(extension)]
     return db
 
 
-def get_path_items(path: Path, recursive: bool = False) -> list[Path]:
+def iter_path_items(path: Path, recursive: bool = False) -> Iterator[Path]:
     """
-    Get a list of Path items from a Path.
+    Lazily yield the Path items found in a Path, without building the whole list first.
+    Subdirectories that cannot be read are skipped.
     :param path: Path to get the items from.
-    :param recursive: Whether to list items recursively.
-    :return: List of Path items from the path.
+    :param recursive: Whether to yield items recursively.
+    :return: Iterator over the Path items of the path.
     """
-    items = []
-
     with os.scandir(path) as entries:
         for entry in entries:
-            try:
-                entry_path = Path(entry.path)
-                items.append(entry_path)
+            entry_path = Path(entry.path)
+            yield entry_path
+            if recursive and entry.is_dir():
+                try:
+                    yield from iter_path_items(entry_path, recursive=True)
+                except PermissionError:
+                    continue
 
-                if recursive and entry.is_dir():
-                    items.extend(get_path_items(entry_path, recursive=True))
-            except PermissionError:
-                continue
 
-    return items
+def get_path_items(path: Path, recursive: bool = False) -> list[Path]:
+    """
+    Get a list of Path items from a Path.
+    :param path: Path to get the items from.
+    :param recursive: Whether to list items recursively.
+    :return: List of Path items from the path.
+    """
+    return list(iter_path_items(path, recursive))
 
 
 def clear_or_move_to_temp(path: Path, temp_path: Path | None = None, move_to_temp: bool = False):
@@ -324,7 +332,8 @@ def clear_or_move_to_temp(path: Path, temp_path: Path | None = None, move_to_tem
 
 
 def random_subfolder(path: Path) -> Path:
-    subdirs = [p for p in path.iterdir() if p.is_dir()]
+    with os.scandir(path) as entries:
+        subdirs = [Path(entry.path) for entry in entries if entry.is_dir()]
     if not subdirs:
         return None  # o lancia un'eccezione, a seconda delle esigenze
     return random.choice(subdirs)
@@ -338,14 +347,15 @@ def clear_folder_contents(path: Path):
     """
     if not path.is_dir():
         raise NotADirectoryError(f"The provided path {path} is not a directory.")
-    for item in path.iterdir():
-        try:
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                item.unlink()
-        except Exception as e:
-            logger.error(f"Error deleting {item}: {e}")
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except Exception as e:
+                logger.error(f"Error deleting {entry.path}: {e}")
 
 
 def count_items(dir_path: Path) -> int:
@@ -354,7 +364,8 @@ def count_items(dir_path: Path) -> int:
     """
     if not dir_path.is_dir():
         raise ValueError(f"{dir_path!r} non è una directory valida")
-    return sum(1 for _ in dir_path.iterdir())
+    with os.scandir(dir_path) as entries:
+        return sum(1 for _ in entries)
 
 
 def duplicate_directory(
@@ -13,15 +13,16 @@ Classes:
     SnapshotCatalogue – High-level catalogue API.
 """
 
-import json
+import os
 import re
 import shutil
 import tempfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from pylizlib.core.data.json import loads
 from pylizlib.core.log.pylizLogger import logger
 from pylizlib.core.os.path import clear_or_move_to_temp
 from pylizlib.core.os.snap.domain import (
@@ -268,6 +269,25 @@ class SnapshotCatalogue:
             snap_manager.create_backup(self.settings.backup_path, "beforeDelete", BackupType.SNAPSHOT_DIRECTORY)
         snap_manager.delete()
 
+    def iter_all(self) -> Iterator[Snapshot]:
+        """
+        Lazily yields the snapshots in the catalogue, loading each one only when it is reached.
+
+        Yields:
+            The Snapshot objects found in the catalogue.
+        """
+        try:
+            entries = os.scandir(self.path_catalogue)
+        except FileNotFoundError:
+            # The catalogue folder is created on init; if it was removed since, it is simply empty
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    snap = SnapshotUtils.get_snapshot_from_path(Path(entry.path), self.settings.json_filename)
+                    if snap is not None:
+                        yield snap
+
     def get_all(self) -> list[Snapshot]:
         """
         Retrieves all snapshots from the catalogue.
@@ -275,14 +295,22 @@ class SnapshotCatalogue:
         Returns:
             A list of Snapshot objects found in the catalogue.
         """
-        self.path_catalogue.mkdir(parents=True, exist_ok=True)
-        snapshots: list[Snapshot] = []
-        for current_dir in self.path_catalogue.iterdir():
-            if current_dir.is_dir():
-                snap = SnapshotUtils.get_snapshot_from_path(current_dir, self.settings.json_filename)
-                if snap is not None:
-                    snapshots.append(snap)
-        return snapshots
+        return list(self.iter_all())
+
+    def list_ids(self) -> list[str]:
+        """
+        Lists the IDs of the snapshots in the catalogue without parsing any snapshot JSON.
+
+        Snapshot folders are named after their ID, so the directory listing is enough.
+
+        Returns:
+            The IDs of the snapshots found in the catalogue.
+        """
+        try:
+            with os.scandir(self.path_catalogue) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []
 
     def get_by_id(self, snap_id: str) -> Optional[Snapshot]:
         """
@@ -294,11 +322,14 @@ class SnapshotCatalogue:
         Returns:
             The Snapshot object if found, otherwise None.
         """
-        all_snaps = self.get_all()
-        for snap in all_snaps:
-            if snap.id == snap_id:
-                return snap
-        return None
+        # The snapshot folder is named after its ID, so only that folder's JSON needs to be parsed.
+        path_snapshot = SnapshotUtils.get_snapshot_path(snap_id, self.path_catalogue)
+        if not path_snapshot.joinpath(self.settings.json_filename).is_file():
+            return None
+        snap = SnapshotUtils.get_snapshot_from_path(path_snapshot, self.settings.json_filename)
+        if snap is None or snap.id != snap_id:
+            return None
+        return snap
 
     def update_snapshot_by_objs(self, old: Snapshot, new: Snapshot):
         """
@@ -451,7 +482,7 @@ class SnapshotCatalogue:
 
                 try:
                     # Read just the ID to avoid loading the whole object unnecessarily
-                    data = json.loads(json_path.read_text(encoding="utf-8"))
+                    data = loads(json_path.read_bytes())
                     snap_id = data.get("id")
                     if not snap_id:
                         logger.warning(f"Skipping directory '{potential_snap_dir.name}' as snapshot ID is missing from json.")
@@ -16,11 +16,16 @@ Classes:
     Snapshot            – A named collection of directory associations.
 """
 
+import os
 import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import ClassVar, Optional
 
 from pylizlib.core.data.gen import gen_random_string
@@ -28,6 +33,44 @@ from pylizlib.core.log.pylizLogger import logger
 from pylizlib.core.os.path import random_subfolder
 from pylizlib.core.os.utils import get_folder_size_mb
 
+# Upper bound for concurrent top-level copies in SnapDirAssociation.copy_install_to
+_COPY_MAX_WORKERS = 8
+
+# Guards SnapDirAssociation._current_index, whose read-increment-write is not atomic
+_INDEX_LOCK = threading.Lock()
+
+# GNU cp, used for reflink-aware tree copies on Linux (None elsewhere)
+_CP = shutil.which("cp") if sys.platform.startswith("linux") else None
+
+
+def _fast_copytree(src: str, dst: Path) -> None:
+    """
+    Copies a directory tree like shutil.copytree, delegating to `cp --reflink=auto` on Linux.
+
+    On copy-on-write filesystems (btrfs, xfs) the files are cloned instead of copied. Symlinks are
+    followed and mode/timestamps preserved, matching shutil.copytree's defaults. Falls back to
+    shutil.copytree when cp is unavailable or fails.
+
+    Args:
+        src: The source directory.
+        dst: The destination directory, which must not exist yet.
+
+    Raises:
+        FileExistsError: If `dst` already exists.
+    """
+    dst.mkdir()
+    if _CP is not None:
+        try:
+            subprocess.run(
+                [_CP, "-R", "-L", "-T", "--preserve=mode,timestamps", "--reflink=auto", src, str(dst)],
+                check=True,
+                capture_output=True,
+            )
+            return
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.debug(f"cp failed for {src}, falling back to shutil.copytree: {e}")
+    shutil.copytree(src, dst, dirs_exist_ok=True)
+
 
 @dataclass
 class SnapDirAssociation:
@@ -62,17 +105,21 @@ class SnapDirAssociation:
     def next_index(cls):
         """
         Increments and returns the class-level index for new directory associations.
+        Safe to call from multiple threads.
 
         Returns:
             The next integer index.
         """
-        cls._current_index += 1
-        return cls._current_index
+        with _INDEX_LOCK:
+            cls._current_index += 1
+            return cls._current_index
 
     @property
     def directory_name(self) -> str:
         """The name of the directory when copied into the snapshot folder."""
-        return self.index.__str__() + "-" + Path(self.original_path).name
+        # PurePath skips the filesystem-aware Path machinery but keeps Path's name semantics
+        # ("a/." and "a//" both name "a"), which existing catalogues depend on
+        return f"{self.index}-{PurePath(self.original_path).name}"
 
     @staticmethod
     def gen_random(
@@ -115,6 +162,8 @@ class SnapDirAssociation:
         into a subdirectory within the given `catalogue_target_path`.
 
         The new subdirectory will be named using the `directory_name` property.
+        Top-level entries are copied concurrently on a small thread pool, since the
+        copy is I/O bound and shutil releases the GIL while moving file data.
 
         Args:
             catalogue_target_path: The base path in the catalogue where the directory
@@ -124,12 +173,22 @@ class SnapDirAssociation:
         destination = catalogue_target_path.joinpath(self.directory_name)
         destination.mkdir(parents=True, exist_ok=True)
 
-        for src_path in source.iterdir():
-            dst_path = destination / src_path.name
-            if src_path.is_dir():
-                shutil.copytree(src_path, dst_path)
-            else:
-                shutil.copy2(src_path, dst_path)
+        # DirEntry.is_dir() is answered from the directory listing, without an extra stat per entry
+        with os.scandir(source) as it:
+            entries = [(entry.path, destination / entry.name, entry.is_dir()) for entry in it]
+        if not entries:
+            return
+        with ThreadPoolExecutor(max_workers=min(_COPY_MAX_WORKERS, len(entries))) as executor:
+            # list() consumes the results so the first copy error is re-raised here
+            list(executor.map(lambda entry: self._copy_entry(*entry), entries))
+
+    @staticmethod
+    def _copy_entry(src_path: str, dst_path: Path, is_dir: bool) -> None:
+        """Copies a single file or directory tree, preserving metadata."""
+        if is_dir:
+            _fast_copytree(src_path, dst_path)
+        else:
+            shutil.copy2(src_path, dst_path)
 
 
 class SnapEditType(Enum):
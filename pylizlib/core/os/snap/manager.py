@@ -86,21 +86,33 @@ class SnapshotManager:
         Updates the 'data' and 'date_last_modified' fields in the snapshot's JSON file.
         This method is typically called after modifying the snapshot's data dictionary.
         """
-        SnapshotSerializer.update_field(self.path_snapshot_json, "data", self.snapshot.data)
-        SnapshotSerializer.update_field(self.path_snapshot_json, "date_last_modified", datetime.now().isoformat())
-        self.snapshot.date_last_modified = datetime.now()
+        now = datetime.now()
+        SnapshotSerializer.update_fields(
+            self.path_snapshot_json,
+            {
+                "data": self.snapshot.data,
+                "date_last_modified": now.isoformat(),
+            },
+        )
+        self.snapshot.date_last_modified = now
 
     def update_json_base_fields(self):
         """
         Updates the basic metadata fields (name, desc, author, tags, date_modified)
         of the snapshot's JSON file.
         """
-        SnapshotSerializer.update_field(self.path_snapshot_json, "name", self.snapshot.name)
-        SnapshotSerializer.update_field(self.path_snapshot_json, "desc", self.snapshot.desc)
-        SnapshotSerializer.update_field(self.path_snapshot_json, "author", self.snapshot.author)
-        SnapshotSerializer.update_field(self.path_snapshot_json, "tags", self.snapshot.tags)
-        SnapshotSerializer.update_field(self.path_snapshot_json, "date_modified", datetime.now().isoformat())
-        self.snapshot.date_modified = datetime.now()
+        now = datetime.now()
+        SnapshotSerializer.update_fields(
+            self.path_snapshot_json,
+            {
+                "name": self.snapshot.name,
+                "desc": self.snapshot.desc,
+                "author": self.snapshot.author,
+                "tags": self.snapshot.tags,
+                "date_modified": now.isoformat(),
+            },
+        )
+        self.snapshot.date_modified = now
 
     def install_directory(self, destination_path: Path):
         """
@@ -264,26 +276,27 @@ class SnapshotManager:
 
             # 2. Clear the contents of the destination directory.
             logger.info(f"Clearing contents of '{install_location}' before install.")
-            for item in install_location.iterdir():
-                try:
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
-                except Exception as e:
-                    logger.error(f"Could not remove item {item} during clean install: {e}")
+            with os.scandir(install_location) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
+                    except Exception as e:
+                        logger.error(f"Could not remove item {entry.path} during clean install: {e}")
 
             # 3. Copy the contents from the source directory to the now-empty destination.
-            for item in source_dir.iterdir():
-                src_item = source_dir / item.name
-                dst_item = install_location / item.name
-                try:
-                    if src_item.is_dir():
-                        shutil.copytree(src_item, dst_item)
-                    else:
-                        shutil.copy2(src_item, dst_item)
-                except Exception as e:
-                    logger.error(f"Could not copy item {src_item} during install: {e}")
+            with os.scandir(source_dir) as entries:
+                for entry in entries:
+                    dst_item = install_location / entry.name
+                    try:
+                        if entry.is_dir():
+                            shutil.copytree(entry.path, dst_item)
+                        else:
+                            shutil.copy2(entry.path, dst_item)
+                    except Exception as e:
+                        logger.error(f"Could not copy item {entry.path} during install: {e}")
 
             # 4. Set permissions if on Windows and pywin32 is installed
             if win32security:
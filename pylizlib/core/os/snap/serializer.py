@@ -4,21 +4,39 @@ JSON serialization and deserialization for the Snapshot model.
 Responsibilities (Single Responsibility Principle):
     - Converting a Snapshot object to a JSON file on disk.
     - Reconstructing a Snapshot object from a JSON file.
-    - Updating a single field in an existing JSON file without a full round-trip.
+    - Updating one or more fields in an existing JSON file without a full round-trip.
 
 Classes:
     SnapshotSerializer – Static helpers for snapshot JSON I/O.
 """
 
-import json
-from dataclasses import asdict
+import os
+import stat
+import tempfile
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import get_args
 
+from pylizlib.core.data.json import dumps, loads
 from pylizlib.core.os.snap.domain import Snapshot, SnapDirAssociation
 
 
+def _read_umask() -> int:
+    """Returns the process umask. os.umask can only be read by setting it, so this runs once at import."""
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+# Mode a plain open() would give a new file; temporary files are created 0600 instead
+_NEW_FILE_MODE = 0o666 & ~_read_umask()
+
+# Snapshot fields declared as datetime (or datetime | None), stored as ISO 8601 strings on disk
+_SNAPSHOT_DATETIME_FIELDS = tuple(f.name for f in fields(Snapshot) if f.type is datetime or datetime in get_args(f.type))
+
+
 class SnapshotSerializer:
     @staticmethod
     def _converter(o):
@@ -34,37 +52,74 @@ class SnapshotSerializer:
         Raises:
             TypeError: If the object type is not supported.
         """
+        # orjson encodes datetimes natively; this branch only serves the stdlib fallback
         if isinstance(o, datetime):
             return o.isoformat()
         if isinstance(o, Enum):
             return o.value  # or o.name if you prefer the name
+        if is_dataclass(o) and not isinstance(o, type):
+            # Shallow field map: the encoder recurses into nested values itself (stdlib fallback only)
+            return {f.name: getattr(o, f.name) for f in fields(o)}
         raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
 
     @staticmethod
-    def to_json(snapshot: Snapshot, path: Path) -> None:
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """
+        Writes bytes to a uniquely named sibling temporary file and renames it over `path`.
+
+        The data is fsynced before os.replace, which is atomic on POSIX and Windows, so readers
+        never observe a truncated file and a crash mid-write leaves the previous content intact.
+        Concurrent writers each get their own temporary file. An existing file keeps its mode and a
+        new one gets the usual 0666 & ~umask, not the 0600 of the temporary file.
+
+        Args:
+            path: The destination file path.
+            data: The bytes to write.
+        """
+        tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False)
+        tmp_path = Path(tmp.name)
+        try:
+            # The handle is closed before os.replace, which Windows requires
+            with tmp:
+                tmp.write(data)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            try:
+                mode = stat.S_IMODE(path.stat().st_mode)
+            except FileNotFoundError:
+                mode = _NEW_FILE_MODE
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def to_json(snapshot: Snapshot, path: Path, pretty: bool = False) -> None:
         """
         Serializes a Snapshot object to a JSON file.
 
+        The dataclass is handed to the encoder as is instead of going through
+        dataclasses.asdict(), which would deep-copy every nested value first. With the
+        stdlib encoder, _converter turns each dataclass into a shallow field map and the
+        encoder recurses into it; with orjson (the 'perf' extra) the fields are encoded
+        natively and _converter is not called for them. The output is compact by default,
+        since the file is only read back by the library.
+
         Args:
             snapshot: The Snapshot object to serialize.
             path: The file path where the JSON data will be saved.
+            pretty: Indent the output for human inspection.
         """
-        data_dict = asdict(snapshot)
-        json_str = json.dumps(data_dict, default=SnapshotSerializer._converter, indent=4)
-        path.write_text(json_str, encoding="utf-8")
+        SnapshotSerializer._write_atomic(path, dumps(snapshot, default=SnapshotSerializer._converter, indent=pretty))
 
     @classmethod
     def from_json(cls, filepath: Path) -> Snapshot:
         """Reads a Snapshot from a JSON file, converting datetimes and enums."""
-        data = json.loads(filepath.read_text(encoding="utf-8"))
+        data = loads(filepath.read_bytes())
 
         # Convert datetime fields from ISO8601 string to datetime
-        for key in [
-            "date_created",
-            "date_modified",
-            "date_last_used",
-            "date_last_modified",
-        ]:
+        for key in _SNAPSHOT_DATETIME_FIELDS:
             if key in data and data[key] is not None:
                 data[key] = datetime.fromisoformat(data[key])
 
@@ -89,12 +144,23 @@ class SnapshotSerializer:
             field_name: The name of the field to update.
             new_value: The new value for the field.
         """
+        cls.update_fields(filepath, {field_name: new_value})
+
+    @classmethod
+    def update_fields(cls, filepath: Path, patch: dict):
+        """
+        Updates several fields of a snapshot's JSON file with a single read and a single write.
+
+        Args:
+            filepath: The path to the JSON file.
+            patch: Mapping of field names to their new values. Datetimes may be passed
+                as is and are stored in ISO 8601 format.
+        """
         # Read existing data from the JSON file
-        data = json.loads(filepath.read_text(encoding="utf-8"))
+        data = loads(filepath.read_bytes())
 
-        # Update only the specified field
-        data[field_name] = new_value
+        # Update only the specified fields
+        data.update(patch)
 
-        # Serialize the file again with converters for datetime and enum if necessary
-        json_str = json.dumps(data, default=cls._converter, indent=4)
-        filepath.write_text(json_str, encoding="utf-8")
+        # Serialize the file again (compact) with converters for datetime and enum if necessary
+        cls._write_atomic(filepath, dumps(data, default=cls._converter))
@@ -4,29 +4,62 @@ import platform
 import shutil
 import subprocess
 from pathlib import Path
+from typing import Iterator
 
 import psutil
 
 PATH_DEFAULT_GIT_BASH = Path(r"C:\Program Files\Git\bin\bash.exe")
 
 
+def iter_tree_files(path, recursive: bool = True) -> Iterator[os.DirEntry]:
+    """
+    Yield the non-directory entries below a directory with os.scandir, without following symlinked directories.
+    Directories that cannot be read (permission denied, removed meanwhile) are skipped, as os.walk does.
+    :param path: path to the directory
+    :param recursive: whether to descend into subdirectories
+    :return: iterator over the os.DirEntry of every non-directory entry
+    """
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if not is_dir:
+                    yield entry
+                elif recursive:
+                    pending.append(entry.path)
+
+
+def _get_tree_size_byte(path) -> int:
+    """
+    Sum the size of every regular file below a directory using a single os.scandir pass
+    :param path: path to the directory
+    :return: total size in bytes (entries that cannot be read are skipped)
+    """
+    total_size = 0
+    for entry in iter_tree_files(path):
+        try:
+            if entry.is_file():
+                total_size += entry.stat().st_size
+        except OSError:
+            continue
+    return total_size
+
+
 def get_folder_size_mb(path) -> float:
     """
     Get the size of a folder in megabytes
     :param path: path to the folder
     :return: size of the folder in megabytes
     """
-    # Inizializza la dimensione totale a 0
-    total_size = 0
-    # Scansione delle cartelle e dei file all'interno del percorso dato
-    for root, dirs, files in os.walk(path):
-        # Aggiungi le dimensioni dei file alla dimensione totale
-        for file in files:
-            file_path = os.path.join(root, file)
-            total_size += os.path.getsize(file_path)
-    # Converti la dimensione totale in megabyte (MB)
-    total_size_mb = total_size / (1024 * 1024)
-    return total_size_mb
+    return _get_tree_size_byte(path) / (1024 * 1024)
 
 
 def open_system_folder(path):
@@ -78,12 +111,7 @@ def get_directory_size(path) -> float:
     :param path: path to the directory
     :return: size of the directory in megabytes
     """
-    total_size = 0
-    for dirpath, dirnames, filenames in os.walk(path):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            total_size += os.path.getsize(fp)
-    return total_size / (1024 * 1024)
+    return _get_tree_size_byte(path) / (1024 * 1024)
 
 
 def check_move_dirs_free_space(src_path, dst_path) -> bool:
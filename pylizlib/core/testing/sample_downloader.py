@@ -7,6 +7,7 @@ no API key required.
 
 import hashlib
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -116,10 +117,14 @@ class SampleImageDownloader:
         prefix: str = "image",
         seeds: Optional[list[str]] = None,
         timeout: int = 15,
+        max_workers: int = 8,
     ) -> list[Path]:
         """
         Downloads *count* images into *folder*.
 
+        Images are fetched concurrently on a thread pool, since each download
+        is dominated by network latency.
+
         Args:
             folder: Target directory (created if it does not exist).
             count: Number of images to download.
@@ -129,27 +134,35 @@ class SampleImageDownloader:
             seeds: Optional list of seed strings (one per image).
                    If shorter than *count*, missing seeds fall back to ``"{prefix}_{i}"``.
             timeout: HTTP request timeout per image in seconds.
+            max_workers: Maximum number of images downloaded in parallel.
 
         Returns:
-            List of paths to the successfully downloaded files.
+            List of paths to the successfully downloaded files, in index order.
         """
         folder.mkdir(parents=True, exist_ok=True)
+        if count <= 0:
+            return []
+
+        seed_list = [seeds[i] if seeds and i < len(seeds) else f"{prefix}_{i}" for i in range(count)]
         downloaded: list[Path] = []
 
-        for i in range(count):
-            seed = seeds[i] if seeds and i < len(seeds) else f"{prefix}_{i}"
-            dest = folder / f"{prefix}_{i}.jpg"
-            try:
-                path = self.download_image(
-                    destination=dest,
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, count))) as executor:
+            futures = [
+                executor.submit(
+                    self.download_image,
+                    destination=folder / f"{prefix}_{i}.jpg",
                     width=width,
                     height=height,
                     seed=seed,
                     timeout=timeout,
                 )
-                downloaded.append(path)
-            except Exception as exc:
-                logger.error(f"[SampleImageDownloader] Failed to download image {i} (seed='{seed}'): {exc}")
+                for i, seed in enumerate(seed_list)
+            ]
+            for i, future in enumerate(futures):
+                try:
+                    downloaded.append(future.result())
+                except Exception as exc:
+                    logger.error(f"[SampleImageDownloader] Failed to download image {i} (seed='{seed_list[i]}'): {exc}")
 
         return downloaded
 
@@ -1,3 +1,10 @@
-import typer
+def __getattr__(name: str):
+    # The Typer app is built on first access, so importing pylizlib.media submodules
+    # neither pays for nor requires the typer import.
+    if name == "pyliz_media":
+        import typer
 
-pyliz_media = typer.Typer(help="General utility scripts.")
+        app = typer.Typer(help="General utility scripts.")
+        globals()[name] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
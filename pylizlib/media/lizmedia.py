@@ -4,6 +4,7 @@ import os
 from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from itertools import count
 from pathlib import Path
 from typing import Any, List, Optional
@@ -14,7 +15,7 @@ from sd_parsers.data import PromptInfo
 
 from pylizlib.core.domain.os import FileType
 from pylizlib.core.log.pylizLogger import logger
-from pylizlib.core.os.file import get_file_c_date, get_file_type, is_media_file
+from pylizlib.core.os.file import get_file_type, get_stat_c_date, is_media_file
 from pylizlib.media.util.metadata import MetadataHandler
 from pylizlib.media.util.video import VideoUtils
 
@@ -31,7 +32,7 @@ class MediaStatus(str, Enum):
 _search_result_counter = count(1)
 
 
-@dataclass
+@dataclass(slots=True)
 class LizMediaSearchResult:
     status: MediaStatus
     path: Path
@@ -48,7 +49,7 @@ class LizMediaSearchResult:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaListResult:
     """
     Represents a collection of media files, distinguishing between those successfully found
@@ -113,6 +114,15 @@ class LizMedia:
         if not is_media_file(self.path.__str__()):
             raise ValueError(f"File {self.path} is not a media file.")
 
+    def __setattr__(self, name: str, value: Any):
+        """
+        Sets an attribute; assigning `path` drops the cached_property values derived from the old file.
+        """
+        super().__setattr__(name, value)
+        if name == "path":
+            for cached_name in _PATH_CACHED_PROPERTIES:
+                self.__dict__.pop(cached_name, None)
+
     # ---- GENERAL FILE INFO
 
     @property
@@ -135,17 +145,28 @@ class LizMedia:
         """
         return self.path.suffix.lower()
 
-    @property
+    @cached_property
+    def _stat(self) -> os.stat_result:
+        """
+        Single os.stat() of the media file, shared by size and creation time.
+
+        Returns:
+            os.stat_result: The stat result, resolved on first access and cached on the instance.
+        """
+        return os.stat(self.path)
+
+    @cached_property
     def creation_time(self) -> datetime:
         """
         Gets the creation date and time of the file.
 
-        Uses the file system's creation time metadata.
+        Uses the file system's creation time metadata. Resolved on first access and cached
+        on the instance.
 
         Returns:
             datetime: The creation timestamp as a datetime object.
         """
-        return get_file_c_date(self.path.__str__())
+        return get_stat_c_date(self._stat)
 
     @property
     def creation_time_timestamp(self) -> float:
@@ -187,15 +208,15 @@ class LizMedia:
         """
         return self.creation_time.day
 
-    @property
+    @cached_property
     def size_byte(self) -> int:
         """
-        Gets the file size in bytes.
+        Gets the file size in bytes, resolved on first access and cached on the instance.
 
         Returns:
             int: The size of the file in bytes.
         """
-        return os.path.getsize(self.path.__str__())
+        return self._stat.st_size
 
     @property
     def size_mb(self) -> float:
@@ -207,10 +228,10 @@ class LizMedia:
         """
         return self.size_byte / 1000000
 
-    @property
+    @cached_property
     def type(self) -> FileType:
         """
-        Determines the type of the media file (Image, Video, etc.).
+        Determines the type of the media file (Image, Video, etc.), cached after the first lookup.
 
         Returns:
             FileType: An enum representing the file type.
@@ -249,13 +270,13 @@ class LizMedia:
 
     # ---- IMAGE FILE INFO
 
-    @property
+    @cached_property
     def stable_diffusion_metadata(self) -> PromptInfo | None:
         """
         Attempts to retrieve Stable Diffusion generation metadata from the image.
 
         Uses `sd_parsers` to extract prompt information from supported image formats.
-        Logs an error if parsing fails.
+        Logs an error if parsing fails. The result is cached on the instance.
 
         Returns:
             PromptInfo | None: The parsed prompt information if available, otherwise None.
@@ -451,6 +472,16 @@ class LizMedia:
 
         return None
 
+    @staticmethod
+    def _safe_value(getter, *, default: Any = None) -> Any:
+        """
+        Resolves a value, returning the provided default if resolution raises.
+        """
+        try:
+            return getter()
+        except Exception:
+            return default
+
     def _safe_json_value(self, getter, *, default: Any = None) -> Any:
         """
         Safely resolves a value and converts it to a JSON-friendly representation.
@@ -473,8 +504,11 @@ class LizMedia:
         Returns:
             dict[str, Any]: Full serialized representation of this media.
         """
-        is_image = self._safe_json_value(lambda: self.is_image)
-        is_video = self._safe_json_value(lambda: self.is_video)
+        # Derived properties are cached on the instance, so keys sharing a value resolve it only once.
+        file_type = self._safe_value(lambda: self.type)
+        is_image = self.is_image if file_type is not None else None
+        is_video = self.is_video if file_type is not None else None
+        is_audio = self.is_audio if file_type is not None else None
 
         return {
             "path": self._serialize_json_value(self.path),
@@ -488,18 +522,13 @@ class LizMedia:
             "day": self._safe_json_value(lambda: self.day),
             "size_byte": self._safe_json_value(lambda: self.size_byte),
             "size_mb": self._safe_json_value(lambda: self.size_mb),
-            "type": self._safe_json_value(lambda: self.type),
+            "type": self._serialize_json_value(file_type),
             "is_image": is_image,
             "is_video": is_video,
-            "is_audio": self._safe_json_value(lambda: self.is_audio),
-            "stable_diffusion_metadata": self._safe_json_value(
-                lambda: self.stable_diffusion_metadata,
-                default=None,
-            )
-            if is_image
-            else None,
+            "is_audio": is_audio,
+            "stable_diffusion_metadata": self._safe_json_value(lambda: self.stable_diffusion_metadata) if is_image else None,
             "has_exif_data": self._safe_json_value(lambda: self.has_exif_data, default=None) if is_image else None,
-            "ai_generated": self._safe_json_value(lambda: self.ai_generated, default=None) if is_image else None,
+            "ai_generated": self._safe_json_value(lambda: self.ai_generated) if is_image else None,
             "duration_sec": self._safe_json_value(lambda: self.duration_sec),
             "duration_min": self._safe_json_value(lambda: self.duration_min),
             "frame_rate": self._safe_json_value(lambda: self.frame_rate),
@@ -628,10 +657,10 @@ class LizMedia:
 
     # ---- VIDEO FILE INFO
 
-    @property
+    @cached_property
     def duration_sec(self) -> float | None:
         """
-        Gets the duration of the video in seconds.
+        Gets the duration of the video in seconds, probed on first access and cached on the instance.
 
         Returns:
             float | None: The duration in seconds, or None if not a video or duration cannot be determined.
@@ -655,10 +684,10 @@ class LizMedia:
             return duration / 60
         return None
 
-    @property
+    @cached_property
     def frame_rate(self) -> float | None:
         """
-        Gets the frame rate (FPS) of the video.
+        Gets the frame rate (FPS) of the video, probed on first access and cached on the instance.
 
         Returns:
             float | None: The frame rate, or None if not a video or cannot be determined.
@@ -747,3 +776,7 @@ class LizMedia:
             if sidecar.suffix.lower() == ".xmp":
                 return sidecar
         return None
+
+
+# cached_property values of LizMedia derived from its path, cleared whenever `path` is reassigned
+_PATH_CACHED_PROPERTIES = tuple(name for name, value in vars(LizMedia).items() if isinstance(value, cached_property))
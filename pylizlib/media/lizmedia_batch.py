@@ -0,0 +1,144 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List
+
+import numpy as np
+
+from pylizlib.core.domain.os import FileType
+from pylizlib.core.os.file import get_extension_file_type, get_stat_c_timestamp
+from pylizlib.core.os.utils import iter_tree_files
+from pylizlib.media.lizmedia import LizMedia
+
+_MEDIA_FILE_TYPES = (FileType.IMAGE, FileType.VIDEO, FileType.AUDIO)
+
+
+# eq=False: the generated __eq__ would compare NumPy arrays, whose truth value is ambiguous
+@dataclass(slots=True, eq=False)
+class LizMediaBatch:
+    """
+    Columnar (struct-of-arrays) view of many media files.
+
+    Each attribute is a NumPy array with one entry per file, filled with a single stat per file.
+    Bulk filtering and grouping (e.g. "videos larger than 10 MB") become boolean-mask operations
+    instead of Python loops over LizMedia objects; use `to_media_list` to materialize the selection.
+
+    Attributes:
+        paths (np.ndarray): Object array of file paths as strings.
+        sizes (np.ndarray): int64 array of file sizes in bytes.
+        creation_times (np.ndarray): float64 array of creation timestamps (same rules as LizMedia.creation_time).
+        is_image (np.ndarray): Boolean mask of image files.
+        is_video (np.ndarray): Boolean mask of video files.
+        is_audio (np.ndarray): Boolean mask of audio files.
+    """
+
+    paths: np.ndarray
+    sizes: np.ndarray
+    creation_times: np.ndarray
+    is_image: np.ndarray
+    is_video: np.ndarray
+    is_audio: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @classmethod
+    def from_dir(cls, path: str | Path, recursive: bool = False) -> "LizMediaBatch":
+        """
+        Builds a batch from the media files found in a directory with os.scandir.
+
+        Args:
+            path: Directory to scan.
+            recursive: Whether to descend into subdirectories (symlinked directories are not followed).
+                Directories and files that cannot be read are skipped.
+
+        Returns:
+            LizMediaBatch: The media files found, in scan order.
+        """
+        paths: List[str] = []
+        stats: List[os.stat_result] = []
+        types: List[FileType] = []
+        for entry in iter_tree_files(path, recursive=recursive):
+            file_type = get_extension_file_type(os.path.splitext(entry.name)[1])
+            if file_type not in _MEDIA_FILE_TYPES:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            paths.append(entry.path)
+            stats.append(stat)
+            types.append(file_type)
+        return cls._from_columns(paths, stats, types)
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str | Path]) -> "LizMediaBatch":
+        """
+        Builds a batch from explicit media file paths.
+
+        Args:
+            paths: Media file paths.
+
+        Returns:
+            LizMediaBatch: One row per path, in the given order.
+
+        Raises:
+            ValueError: If a path is not a recognized media file.
+        """
+        str_paths: List[str] = []
+        stats: List[os.stat_result] = []
+        types: List[FileType] = []
+        for media_path in paths:
+            media_path = os.fspath(media_path)
+            file_type = get_extension_file_type(os.path.splitext(media_path)[1])
+            if file_type not in _MEDIA_FILE_TYPES:
+                raise ValueError(f"File {media_path} is not a media file.")
+            str_paths.append(media_path)
+            stats.append(os.stat(media_path))
+            types.append(file_type)
+        return cls._from_columns(str_paths, stats, types)
+
+    @classmethod
+    def _from_columns(cls, paths: List[str], stats: List[os.stat_result], types: List[FileType]) -> "LizMediaBatch":
+        """Converts the per-file lists gathered by the constructors into NumPy columns."""
+        count = len(paths)
+        path_column = np.empty(count, dtype=object)
+        path_column[:] = paths
+        return cls(
+            paths=path_column,
+            sizes=np.fromiter((stat.st_size for stat in stats), dtype=np.int64, count=count),
+            creation_times=np.fromiter((get_stat_c_timestamp(stat) for stat in stats), dtype=np.float64, count=count),
+            is_image=np.fromiter((file_type is FileType.IMAGE for file_type in types), dtype=bool, count=count),
+            is_video=np.fromiter((file_type is FileType.VIDEO for file_type in types), dtype=bool, count=count),
+            is_audio=np.fromiter((file_type is FileType.AUDIO for file_type in types), dtype=bool, count=count),
+        )
+
+    def select(self, mask: np.ndarray) -> "LizMediaBatch":
+        """
+        Returns a new batch containing only the rows selected by a boolean mask (or index array).
+
+        Args:
+            mask: Boolean mask with one entry per file, or an array of row indexes.
+
+        Returns:
+            LizMediaBatch: The selected rows.
+        """
+        return LizMediaBatch(
+            paths=self.paths[mask],
+            sizes=self.sizes[mask],
+            creation_times=self.creation_times[mask],
+            is_image=self.is_image[mask],
+            is_video=self.is_video[mask],
+            is_audio=self.is_audio[mask],
+        )
+
+    def to_media_list(self) -> List[LizMedia]:
+        """
+        Materializes the batch as LizMedia objects.
+
+        Returns:
+            List[LizMedia]: One LizMedia per row, in batch order.
+        """
+        return [LizMedia(Path(media_path)) for media_path in self.paths]
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import base64
-import binascii
 import mimetypes
 import os
 import tempfile
@@ -10,8 +8,19 @@ from pathlib import Path
 
 from PIL import Image
 
+from pylizlib.core.data.b64 import b64decode
 from pylizlib.media.domain.source import ResolvedMediaSource
 
+_PIL_FORMAT_SUFFIXES = {
+    "jpeg": ".jpg",
+    "png": ".png",
+    "webp": ".webp",
+    "bmp": ".bmp",
+    "gif": ".gif",
+    "tiff": ".tiff",
+}
+_MIME_SUFFIX_OVERRIDES = {".jpe": ".jpg", ".qt": ".mov"}
+
 
 def resolve_media_source(
     *,
@@ -43,7 +52,7 @@ def resolve_media_source(
 
     if media_path is not None:
         path = Path(media_path).expanduser().resolve()
-        if not path.exists() or not path.is_file():
+        if not path.is_file():
             raise FileNotFoundError(f"Media file not found: {path}")
         return ResolvedMediaSource(path=path)
 
@@ -67,10 +76,10 @@ def _split_data_uri(value: str) -> tuple[str, str | None]:
 
 
 def _decode_base64(value: str) -> bytes:
-    """Decodes a Base64 string into raw bytes with validation."""
+    """Decodes a Base64 string into raw bytes, validating it in the same pass."""
     try:
-        return base64.b64decode(value, validate=True)
-    except binascii.Error as exc:
+        return b64decode(value, validate=True)
+    except ValueError as exc:
         raise ValueError("Invalid base64 media payload.") from exc
 
 
@@ -101,11 +110,7 @@ def _mime_to_suffix(mime_type: str | None) -> str | None:
         return None
 
     guessed = mimetypes.guess_extension(mime_type)
-    if guessed == ".jpe":
-        return ".jpg"
-    if guessed == ".qt":
-        return ".mov"
-    return guessed
+    return _MIME_SUFFIX_OVERRIDES.get(guessed, guessed)
 
 
 def _detect_image_suffix(raw_bytes: bytes) -> str | None:
@@ -116,14 +121,7 @@ def _detect_image_suffix(raw_bytes: bytes) -> str | None:
     except Exception:
         return None
 
-    return {
-        "jpeg": ".jpg",
-        "png": ".png",
-        "webp": ".webp",
-        "bmp": ".bmp",
-        "gif": ".gif",
-        "tiff": ".tiff",
-    }.get(fmt)
+    return _PIL_FORMAT_SUFFIXES.get(fmt)
 
 
 def _write_temp_file(raw_bytes: bytes, *, suffix: str) -> Path:
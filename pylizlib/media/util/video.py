@@ -1,15 +1,17 @@
 import os
+from typing import TYPE_CHECKING
 
-import cv2
 import ffmpeg
 import numpy as np
 
 from pylizlib.core.log.pylizLogger import logger
 from pylizlib.core.os.path import check_path, check_path_file, get_filename
-from pylizlib.media.compute.frameselector import FrameSelector
 from pylizlib.media.domain.video import FrameOptions
 from pylizlib.media.util.image import save_ndarrays_as_images
 
+if TYPE_CHECKING:
+    from pylizlib.media.compute.frameselector import FrameSelector
+
 
 class VideoUtils:
     """
@@ -60,7 +62,7 @@ class VideoUtils:
     def extract_frame_advanced(
         video_path: str,
         frame_folder: str,
-        frame_selector: FrameSelector,
+        frame_selector: "FrameSelector",
         frame_options: FrameOptions = FrameOptions(),
         use_existing: bool = True,
     ):
@@ -109,6 +111,9 @@ class VideoUtils:
             logger.debug(f"Frames already exist in {output_folder}. Exiting frame extraction.")
             return
 
+        # OpenCV is imported lazily: it is only needed for frame work, not for metadata lookups
+        import cv2
+
         # Open the video
         cap = cv2.VideoCapture(video_path)
 
@@ -204,6 +209,8 @@ class VideoUtils:
         Retrieves the frame rate (FPS) of the video using OpenCV.
         """
         try:
+            import cv2
+
             video = cv2.VideoCapture(path)
             if not video.isOpened():
                 logger.error("Error: could not open video.")
@@ -20,6 +20,18 @@ class _StaticProvider:
         return self.result
 
 
+class _WarmableProvider(_StaticProvider):
+    def __init__(self, tool: AiScanTool, error: Exception | None = None):
+        super().__init__(tool, AiScanResult())
+        self.error = error
+        self.warm_calls = 0
+
+    def warm_up(self) -> None:
+        self.warm_calls += 1
+        if self.error is not None:
+            raise self.error
+
+
 class _FailingProvider:
     tool = AiScanTool.TAGS
 
@@ -96,6 +108,23 @@ class AiMediaScannerTestCase(unittest.TestCase):
         self.assertEqual(media.ai_tags, ["one"])
         self.assertEqual(tags_provider.calls, 1)
 
+    def test_scan_many_preserves_input_order(self):
+        second_path = Path(self.temp_dir.name) / "second.png"
+        Image.new("RGB", (4, 4), color=(0, 255, 0)).save(second_path)
+        tags_provider = _StaticProvider(AiScanTool.TAGS, AiScanResult(tags=["cat"]))
+        scanner = AiMediaScanner(providers=[tags_provider])
+
+        medias = scanner.scan_many(media_paths=[self.image_path, second_path], tools=["tags"], max_workers=2)
+
+        self.assertEqual([media.file_name for media in medias], ["sample.png", "second.png"])
+        self.assertTrue(all(media.ai_tags == ["cat"] for media in medias))
+        self.assertEqual(tags_provider.calls, 2)
+
+    def test_scan_many_with_no_paths_returns_empty_list(self):
+        scanner = AiMediaScanner(providers=[])
+
+        self.assertEqual(scanner.scan_many(media_paths=[], tools=["tags"]), [])
+
     def test_scan_requires_supported_tools(self):
         scanner = AiMediaScanner(providers=[])
         with self.assertRaises(ValueError):
@@ -172,6 +201,35 @@ class AiMediaScannerTestCase(unittest.TestCase):
         self.assertEqual(media.ai_tags, ["motion"])
         self.assertEqual(media.ai_file_name, "test.mp4")
 
+    def test_warm_up_loads_requested_providers_only(self):
+        tags_provider = _WarmableProvider(AiScanTool.TAGS)
+        ocr_provider = _WarmableProvider(AiScanTool.OCR)
+        plain_provider = _StaticProvider(AiScanTool.NSFW, AiScanResult())
+        scanner = AiMediaScanner(providers=[tags_provider, ocr_provider, plain_provider])
+
+        self.assertIsNone(scanner.warm_up(tools=["tags", "nsfw"]))
+        self.assertEqual(tags_provider.warm_calls, 1)
+        self.assertEqual(ocr_provider.warm_calls, 0)
+
+        scanner.warm_up()
+        self.assertEqual(tags_provider.warm_calls, 2)
+        self.assertEqual(ocr_provider.warm_calls, 1)
+
+        with self.assertRaises(ValueError):
+            AiMediaScanner(providers=[tags_provider]).warm_up(tools=["ocr"])
+
+    def test_warm_up_in_background_logs_failures(self):
+        failing_provider = _WarmableProvider(AiScanTool.TAGS, error=ImportError("missing extra"))
+        scanner = AiMediaScanner(providers=[failing_provider])
+
+        thread = scanner.warm_up(background=True)
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(failing_provider.warm_calls, 1)
+        with self.assertRaises(ImportError):
+            scanner.warm_up()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from pylizlib.ai.domain import AiScanResult
+
+
+class AiScanResultTestCase(unittest.TestCase):
+    def test_merge_overwrites_only_non_none_values(self):
+        result = AiScanResult(tags=["cat"], nsfw=False)
+        merged = result.merge(AiScanResult(nsfw=True, ocr_text=["hello"]))
+
+        self.assertIs(merged, result)
+        self.assertEqual(result.tags, ["cat"])
+        self.assertTrue(result.nsfw)
+        self.assertEqual(result.ocr_text, ["hello"])
+        self.assertIsNone(result.ocr_detected)
+
+    def test_merge_keeps_falsy_values(self):
+        result = AiScanResult(tags=["cat"], ocr_detected=True).merge(AiScanResult(tags=[], ocr_detected=False))
+
+        self.assertEqual(result.tags, [])
+        self.assertFalse(result.ocr_detected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import sys
+import threading
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from pylizlib.ai.providers import BaseAiProvider, EasyOcrProvider, JoyTagProvider, NudeNetProvider
+
+
+class ProviderRuntimeCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self._saved_cache = dict(BaseAiProvider._runtime_cache)
+        self._saved_locks = dict(BaseAiProvider._runtime_locks)
+        BaseAiProvider._runtime_cache.clear()
+
+    def tearDown(self):
+        BaseAiProvider._runtime_cache.clear()
+        BaseAiProvider._runtime_cache.update(self._saved_cache)
+        BaseAiProvider._runtime_locks.clear()
+        BaseAiProvider._runtime_locks.update(self._saved_locks)
+
+    def test_nudenet_detector_is_shared_between_instances(self):
+        fake_nudenet = types.ModuleType("nudenet")
+        fake_nudenet.NudeDetector = MagicMock(side_effect=lambda: object())
+
+        with patch.dict(sys.modules, {"nudenet": fake_nudenet}):
+            first = NudeNetProvider()._get_detector()
+            second = NudeNetProvider()._get_detector()
+
+        self.assertIs(first, second)
+        fake_nudenet.NudeDetector.assert_called_once()
+
+    def test_easyocr_reader_is_cached_per_configuration(self):
+        fake_easyocr = types.ModuleType("easyocr")
+        fake_easyocr.Reader = MagicMock(side_effect=lambda *args, **kwargs: object())
+        fake_torch = types.ModuleType("torch")
+        fake_torch.cuda = MagicMock(is_available=MagicMock(return_value=False))
+
+        with patch.dict(sys.modules, {"easyocr": fake_easyocr, "torch": fake_torch}):
+            english = EasyOcrProvider(model_dir="/tmp/models")._get_reader()
+            english_again = EasyOcrProvider(model_dir="/tmp/models")._get_reader()
+            italian = EasyOcrProvider(model_dir="/tmp/models", languages=["it"])._get_reader()
+
+        self.assertIs(english, english_again)
+        self.assertIsNot(english, italian)
+        self.assertEqual(fake_easyocr.Reader.call_count, 2)
+
+    def test_failed_load_is_not_cached(self):
+        with patch.dict(sys.modules, {"nudenet": None}):
+            with self.assertRaises(ImportError):
+                NudeNetProvider()._get_detector()
+
+        self.assertNotIn(("nudenet",), BaseAiProvider._runtime_cache)
+
+    def test_slow_load_does_not_block_other_keys(self):
+        slow_started = threading.Event()
+        release_slow = threading.Event()
+
+        def slow_loader():
+            slow_started.set()
+            release_slow.wait(5)
+            return "slow"
+
+        slow = threading.Thread(target=BaseAiProvider._get_cached_runtime, args=(("slow-test",), slow_loader))
+        slow.start()
+        try:
+            self.assertTrue(slow_started.wait(5))
+            fast = BaseAiProvider._get_cached_runtime(("fast-test",), lambda: "fast")
+            self.assertEqual(fast, "fast")
+            self.assertNotIn(("slow-test",), BaseAiProvider._runtime_cache)
+        finally:
+            release_slow.set()
+            slow.join()
+        self.assertEqual(BaseAiProvider._runtime_cache[("slow-test",)], "slow")
+
+    def test_same_key_is_loaded_once_across_threads(self):
+        loader = MagicMock(side_effect=lambda: object())
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(BaseAiProvider._get_cached_runtime(("once-test",), loader)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        loader.assert_called_once()
+        self.assertEqual(len({id(r) for r in results}), 1)
+
+
+class JoyTagModelResolutionTestCase(unittest.TestCase):
+    class LocalEntryNotFoundError(Exception):
+        pass
+
+    def _fake_modules(self, snapshot_download):
+        hub = types.ModuleType("huggingface_hub")
+        hub.snapshot_download = snapshot_download
+        hub_errors = types.ModuleType("huggingface_hub.errors")
+        hub_errors.LocalEntryNotFoundError = self.LocalEntryNotFoundError
+        torchvision = types.ModuleType("torchvision")
+        transforms = types.ModuleType("torchvision.transforms")
+        functional = types.ModuleType("torchvision.transforms.functional")
+        torchvision.transforms = transforms
+        transforms.functional = functional
+        return {
+            "torch": types.ModuleType("torch"),
+            "torchvision": torchvision,
+            "torchvision.transforms": transforms,
+            "torchvision.transforms.functional": functional,
+            "huggingface_hub": hub,
+            "huggingface_hub.errors": hub_errors,
+        }
+
+    def test_cache_miss_downloads_from_hub(self):
+        stop = RuntimeError("stop after download")
+        snapshot_download = MagicMock(side_effect=[self.LocalEntryNotFoundError("not cached"), stop])
+
+        with patch.dict(sys.modules, self._fake_modules(snapshot_download)):
+            with self.assertRaises(RuntimeError) as ctx:
+                JoyTagProvider(model_dir="/tmp/models")._load_runtime()
+
+        self.assertIs(ctx.exception, stop)
+        self.assertEqual(snapshot_download.call_count, 2)
+        self.assertTrue(snapshot_download.call_args_list[0].kwargs["local_files_only"])
+        self.assertNotIn("local_files_only", snapshot_download.call_args_list[1].kwargs)
+
+    def test_other_cache_errors_are_not_retried(self):
+        snapshot_download = MagicMock(side_effect=PermissionError("cache not readable"))
+
+        with patch.dict(sys.modules, self._fake_modules(snapshot_download)):
+            with self.assertRaises(PermissionError):
+                JoyTagProvider(model_dir="/tmp/models")._load_runtime()
+
+        snapshot_download.assert_called_once()
+
+
+class NudeNetBatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.frames = [np.zeros((4, 4, 3), dtype=np.uint8) for _ in range(3)]
+
+    def test_video_frames_are_detected_in_one_batch(self):
+        detector = MagicMock()
+        detector.detect_batch.return_value = [[], [{"class": "FEMALE_BREAST_EXPOSED", "score": 0.9}], []]
+
+        self.assertTrue(NudeNetProvider()._detect_frames(detector, self.frames))
+        detector.detect_batch.assert_called_once()
+        self.assertEqual(len(detector.detect_batch.call_args.args[0]), 3)
+        detector.detect.assert_not_called()
+
+    def test_stops_at_first_batch_with_a_hit(self):
+        frames = [np.zeros((4, 4, 3), dtype=np.uint8) for _ in range(10)]
+        detector = MagicMock()
+        detector.detect_batch.return_value = [[{"class": "ANUS_EXPOSED", "score": 0.9}], [], [], []]
+
+        self.assertTrue(NudeNetProvider()._detect_frames(detector, frames))
+        detector.detect_batch.assert_called_once()
+        self.assertEqual(len(detector.detect_batch.call_args.args[0]), NudeNetProvider.FRAME_BATCH_SIZE)
+
+    def test_scans_every_batch_without_hits(self):
+        frames = [np.zeros((4, 4, 3), dtype=np.uint8) for _ in range(10)]
+        detector = MagicMock()
+        detector.detect_batch.side_effect = lambda paths: [[] for _ in paths]
+
+        self.assertFalse(NudeNetProvider()._detect_frames(detector, frames))
+        self.assertEqual([len(c.args[0]) for c in detector.detect_batch.call_args_list], [4, 4, 2])
+
+    def test_falls_back_to_per_frame_detection_without_detect_batch(self):
+        detector = MagicMock(spec=["detect"])
+        detector.detect.return_value = []
+
+        self.assertFalse(NudeNetProvider()._detect_frames(detector, self.frames))
+        self.assertEqual(detector.detect.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
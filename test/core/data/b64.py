@@ -0,0 +1,30 @@
+import base64
+import unittest
+from unittest.mock import patch
+
+from pylizlib.core.data.b64 import b64decode, b64encode
+
+
+class B64TestCase(unittest.TestCase):
+    def test_round_trip(self):
+        data = bytes(range(256)) * 3
+        self.assertEqual(b64encode(data), base64.b64encode(data))
+        self.assertEqual(b64decode(b64encode(data)), data)
+
+    def test_decode_validates_alphabet(self):
+        with self.assertRaises(ValueError):
+            b64decode("aGVsbG8*")
+
+    def test_decode_without_validation_discards_invalid_characters(self):
+        self.assertEqual(b64decode("aGVs\nbG8=", validate=False), b"hello")
+
+    def test_stdlib_fallback(self):
+        with patch("pylizlib.core.data.b64._pybase64", None):
+            self.assertEqual(b64encode(b"hello"), b"aGVsbG8=")
+            self.assertEqual(b64decode("aGVsbG8="), b"hello")
+            with self.assertRaises(ValueError):
+                b64decode("aGVsbG8*")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
+from json import JSONDecodeError
+from unittest.mock import patch
 
-from pylizlib.core.data.json import JsonUtils
+from pylizlib.core.data import json as json_module
+from pylizlib.core.data.json import JsonUtils, dumps, loads
 
 
 class JsonUtilsTestCase(unittest.TestCase):
@@ -32,6 +35,45 @@ class JsonUtilsTestCase(unittest.TestCase):
     def test_has_keys_false_for_invalid_json(self):
         self.assertFalse(JsonUtils.has_keys('{"name":', ["name"]))
 
+    def test_parse_object_returns_dict_with_required_keys(self):
+        raw = '{"text": [], "tags": ["a"], "filename": "x.png"}'
+
+        self.assertEqual(JsonUtils.parse_object(raw, ["text", "tags"])["tags"], ["a"])
+        self.assertEqual(JsonUtils.parse_object(b'{"a": 1}'), {"a": 1})
+
+    def test_parse_object_returns_none_when_invalid(self):
+        self.assertIsNone(JsonUtils.parse_object('{"a": 1', ["a"]))
+        self.assertIsNone(JsonUtils.parse_object("[1, 2]"))
+        self.assertIsNone(JsonUtils.parse_object('{"a": 1}', ["a", "b"]))
+        self.assertIsNone(JsonUtils.parse_object(None))
+
+    def test_loads_accepts_str_and_bytes(self):
+        self.assertEqual(loads('{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+
+    def test_loads_raises_json_decode_error(self):
+        with self.assertRaises(JSONDecodeError):
+            loads('{"a": 1')
+
+    def test_loads_falls_back_to_stdlib_without_orjson(self):
+        with patch.object(json_module, "_orjson", None):
+            self.assertEqual(loads(b'{"a": 1}'), {"a": 1})
+            self.assertFalse(JsonUtils.is_valid_json('{"a": 1'))
+
+    def test_dumps_returns_utf8_bytes_and_uses_default(self):
+        payload = {"name": "caffè", "obj": object()}
+        for backend in (json_module._orjson, None):
+            with self.subTest(orjson=backend is not None), patch.object(json_module, "_orjson", backend):
+                encoded = dumps(payload, default=lambda o: "converted", indent=True)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(loads(encoded), {"name": "caffè", "obj": "converted"})
+                self.assertIn("caffè".encode("utf-8"), encoded)
+                self.assertIn(b'\n  "name"', encoded)
+
+    def test_dumps_raises_type_error_without_default(self):
+        with self.assertRaises(TypeError):
+            dumps({"obj": object()})
+
     def test_clean_json_apici_removes_json_fence(self):
         raw = '```json\n{"name":"demo"}\n```'
 
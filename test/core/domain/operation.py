@@ -18,6 +18,24 @@ class OperationDomainTestCase(unittest.TestCase):
         self.assertEqual(op.payload, {"x": 1})
         self.assertTrue(op.is_op_ok())
 
+    def test_ok_and_fail_factories(self):
+        ok = Operation.ok("done")
+        fail = Operation.fail("boom")
+
+        self.assertTrue(ok.is_op_ok())
+        self.assertEqual(ok.payload, "done")
+        self.assertIsNone(ok.error)
+        self.assertFalse(fail.is_op_ok())
+        self.assertIsNone(fail.payload)
+        self.assertEqual(fail.error, "boom")
+
+    def test_uses_slots(self):
+        op = Operation()
+
+        self.assertFalse(hasattr(op, "__dict__"))
+        with self.assertRaises(AttributeError):
+            op.extra = 1
+
     def test_str_contains_fields(self):
         op = Operation(payload="done", status=True, error="none")
         output = str(op)
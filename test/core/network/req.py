@@ -1,14 +1,21 @@
+import asyncio
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import requests
 
+from pylizlib.core.network import req
 from pylizlib.core.network.req import (
     NetResponse,
     NetResponseType,
     exec_get,
+    exec_get_async,
     exec_post,
+    exec_post_async,
     get_file_size_byte,
+    get_session,
     is_endpoint_reachable,
     is_internet_available,
 )
@@ -23,7 +30,7 @@ class NetResponseTestCase(unittest.TestCase):
         response.status_code = 200
         response.text = "ok"
         response.headers = {"Content-Type": "application/json"}
-        response.json.return_value = {"ok": True}
+        response.content = b'{"ok": true}'
 
         wrapped = NetResponse(response, NetResponseType.OK200)
 
@@ -33,24 +40,78 @@ class NetResponseTestCase(unittest.TestCase):
         self.assertTrue(wrapped.is_successful())
         self.assertFalse(wrapped.is_error())
 
+    def test_netresponse_parses_body_lazily(self):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"Content-Type": "application/json"}
+        response.content = b'{"ok": '
+
+        wrapped = NetResponse(response, NetResponseType.OK200)
+
+        self.assertTrue(wrapped.is_successful())
+        self.assertIsNone(wrapped.json)
+
     def test_netresponse_without_response(self):
         wrapped = NetResponse(None, NetResponseType.TIMEOUT, exception=TimeoutError("timeout"))
 
         self.assertFalse(wrapped.hasResponse)
+        self.assertIsNone(wrapped.text)
+        self.assertIsNone(wrapped.json)
         self.assertIn("timeout", wrapped.get_error())
 
 
 class RequestHelpersTestCase(unittest.TestCase):
-    @patch("pylizlib.core.network.req.requests.head")
+    def setUp(self):
+        req._internet_check = None
+
+    def test_get_session_is_shared(self):
+        self.assertIsInstance(get_session(), requests.Session)
+        self.assertIs(get_session(), get_session())
+
+    def test_session_mounts_pooled_retrying_adapter(self):
+        for prefix in ("http://", "https://"):
+            adapter = get_session().get_adapter(prefix + "example.com")
+            self.assertEqual(adapter._pool_maxsize, 32)
+            self.assertEqual(adapter.max_retries.total, 3)
+            self.assertIn(503, adapter.max_retries.status_forcelist)
+            self.assertFalse(adapter.max_retries.raise_on_status)
+
+    def test_probes_do_not_retry_unavailable_endpoints(self):
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def _unavailable(self):
+                hits.append(self.command)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            do_GET = do_HEAD = _unavailable
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_port}/"
+
+        self.assertFalse(_test_with_head(url))
+        self.assertFalse(is_endpoint_reachable(url))
+        self.assertEqual(get_file_size_byte(url), -1)
+        self.assertEqual(hits, ["HEAD", "GET", "HEAD"])
+
+    @patch("pylizlib.core.network.req._probe_session.head")
     def test_test_with_head_true(self, mock_head):
         mock_head.return_value.status_code = 200
         self.assertTrue(_test_with_head("https://example.com"))
 
-    @patch("pylizlib.core.network.req.requests.head", side_effect=requests.RequestException("bad"))
+    @patch("pylizlib.core.network.req._probe_session.head", side_effect=requests.RequestException("bad"))
     def test_test_with_head_false_on_exception(self, _):
         self.assertFalse(_test_with_head("https://example.com"))
 
-    @patch("pylizlib.core.network.req.requests.get")
+    @patch("pylizlib.core.network.req._probe_session.get")
     def test_is_endpoint_reachable(self, mock_get):
         mock_get.return_value.status_code = 200
         self.assertTrue(is_endpoint_reachable("https://example.com"))
@@ -67,7 +128,17 @@ class RequestHelpersTestCase(unittest.TestCase):
     def test_is_internet_available_false(self, _):
         self.assertFalse(is_internet_available())
 
-    @patch("pylizlib.core.network.req.requests.get")
+    @patch("pylizlib.core.network.req.socket.create_connection")
+    def test_is_internet_available_caches_result(self, mock_create_connection):
+        self.assertTrue(is_internet_available())
+        mock_create_connection.side_effect = OSError()
+
+        self.assertTrue(is_internet_available())
+        self.assertEqual(mock_create_connection.call_count, 1)
+        self.assertFalse(is_internet_available(ttl=0))
+        self.assertEqual(mock_create_connection.call_args.kwargs["timeout"], 3)
+
+    @patch("pylizlib.core.network.req._session.get")
     def test_exec_get_ok_and_error(self, mock_get):
         response = MagicMock()
         response.status_code = 200
@@ -82,12 +153,12 @@ class RequestHelpersTestCase(unittest.TestCase):
         result = exec_get("https://example.com")
         self.assertEqual(result.type, NetResponseType.ERROR)
 
-    @patch("pylizlib.core.network.req.requests.get", side_effect=requests.ConnectionError("offline"))
+    @patch("pylizlib.core.network.req._session.get", side_effect=requests.ConnectionError("offline"))
     def test_exec_get_connection_error(self, _):
         result = exec_get("https://example.com")
         self.assertEqual(result.type, NetResponseType.CONNECTION_ERROR)
 
-    @patch("pylizlib.core.network.req.requests.post")
+    @patch("pylizlib.core.network.req._session.post")
     def test_exec_post_ok_and_error(self, mock_post):
         response = MagicMock()
         response.status_code = 200
@@ -100,13 +171,37 @@ class RequestHelpersTestCase(unittest.TestCase):
         response.status_code = 400
         result = exec_post("https://example.com", payload={"x": 1})
         self.assertEqual(result.type, NetResponseType.ERROR)
+        self.assertIsNone(mock_post.call_args.kwargs["timeout"])
+
+        exec_post("https://example.com", payload={"x": 1}, sec_timeout=2)
+        self.assertEqual(mock_post.call_args.kwargs["timeout"], 2)
 
-    @patch("pylizlib.core.network.req.requests.post", side_effect=requests.Timeout("timeout"))
+    @patch("pylizlib.core.network.req._session.post", side_effect=requests.Timeout("timeout"))
     def test_exec_post_timeout(self, _):
         result = exec_post("https://example.com", payload={})
         self.assertEqual(result.type, NetResponseType.TIMEOUT)
 
-    @patch("pylizlib.core.network.req.requests.head")
+    @patch("pylizlib.core.network.req._session.post")
+    def test_exec_post_async_runs_requests_concurrently(self, mock_post):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        mock_post.return_value = response
+
+        async def run():
+            return await asyncio.gather(*(exec_post_async("https://example.com", payload={"i": i}) for i in range(3)))
+
+        results = asyncio.run(run())
+        self.assertEqual([r.type for r in results], [NetResponseType.OK200] * 3)
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertIsNone(mock_post.call_args.kwargs["timeout"])
+
+    @patch("pylizlib.core.network.req._session.get", side_effect=requests.Timeout("timeout"))
+    def test_exec_get_async_timeout(self, _):
+        result = asyncio.run(exec_get_async("https://example.com", sec_timeout=1))
+        self.assertEqual(result.type, NetResponseType.TIMEOUT)
+
+    @patch("pylizlib.core.network.req._probe_session.head")
     def test_get_file_size_byte_success(self, mock_head):
         response = MagicMock()
         response.headers = {"content-length": "42"}
@@ -115,7 +210,7 @@ class RequestHelpersTestCase(unittest.TestCase):
 
         self.assertEqual(get_file_size_byte("https://example.com/file.bin"), 42)
 
-    @patch("pylizlib.core.network.req.requests.head")
+    @patch("pylizlib.core.network.req._probe_session.head")
     def test_get_file_size_byte_missing_header_defaults_zero(self, mock_head):
         response = MagicMock()
         response.headers = {}
@@ -124,7 +219,7 @@ class RequestHelpersTestCase(unittest.TestCase):
 
         self.assertEqual(get_file_size_byte("https://example.com/file.bin"), 0)
 
-    @patch("pylizlib.core.network.req.requests.head", side_effect=requests.RequestException("bad"))
+    @patch("pylizlib.core.network.req._probe_session.head", side_effect=requests.RequestException("bad"))
     def test_get_file_size_byte_fail_modes(self, _):
         self.assertEqual(get_file_size_byte("https://example.com/file.bin"), -1)
         with self.assertRaises(ValueError):
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 from pylizlib.core.domain.os import FileType
 from pylizlib.core.os.file import (
     download_file,
+    get_extension_file_type,
     get_file_c_date,
     get_file_type,
     is_audio_extension,
@@ -147,6 +148,12 @@ class GetFileTypeTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_file_type("archive.zip")
 
+    def test_get_extension_file_type(self):
+        self.assertEqual(get_extension_file_type(".jpg"), FileType.IMAGE)
+        self.assertEqual(get_extension_file_type(".aae"), FileType.MEDIA_SIDECAR)
+        self.assertIsNone(get_extension_file_type(".zip"))
+        self.assertIsNone(get_extension_file_type(""))
+
 
 class IsFileDupInDirTestCase(unittest.TestCase):
     def test_file_found(self):
@@ -169,14 +176,18 @@ class GetFileCDateTestCase(unittest.TestCase):
 
 
 class DownloadFileTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("pylizlib.core.os.file.get_session")
+        self.mock_get = patcher.start().return_value.get
+        self.addCleanup(patcher.stop)
+
     @patch("pylizlib.core.os.file.logger")
-    @patch("pylizlib.core.os.file.requests.get")
-    def test_download_file_success(self, mock_get, mock_logger):
+    def test_download_file_success(self, mock_logger):
         mock_response = MagicMock()
         mock_response.headers = {"content-length": "3"}
         mock_response.iter_content.return_value = [b"abc"]
         mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = mock_response
 
         with tempfile.TemporaryDirectory() as td:
             dest = os.path.join(td, "file.bin")
@@ -187,8 +198,102 @@ class DownloadFileTestCase(unittest.TestCase):
             with open(dest, "rb") as f:
                 self.assertEqual(f.read(), b"abc")
 
-    @patch("pylizlib.core.os.file.requests.get", side_effect=Exception("network error"))
-    def test_download_file_failure(self, mock_get):
+    def test_download_file_overwrites_existing_file_by_default(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-length": "3"}
+        mock_response.iter_content.return_value = [b"new"]
+        self.mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as td:
+            dest = os.path.join(td, "file.bin")
+            with open(dest, "wb") as f:
+                f.write(b"ol")
+            result = download_file("http://example.com/file", dest, None)
+
+            self.assertTrue(result.status)
+            self.assertIsNone(self.mock_get.call_args.kwargs["headers"])
+            with open(dest, "rb") as f:
+                self.assertEqual(f.read(), b"new")
+
+    def test_download_file_resumes_partial_file(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 206
+        mock_response.headers = {"content-length": "3"}
+        mock_response.iter_content.return_value = [b"def"]
+        self.mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as td:
+            dest = os.path.join(td, "file.bin")
+            with open(dest, "wb") as f:
+                f.write(b"abc")
+            os.utime(dest, (784111777, 784111777))
+            progress_values = []
+            result = download_file("http://example.com/file", dest, progress_values.append, resume=True)
+
+            self.assertTrue(result.status)
+            self.assertEqual(
+                self.mock_get.call_args.kwargs["headers"],
+                {"Range": "bytes=3-", "If-Range": "Sun, 06 Nov 1994 08:49:37 GMT"},
+            )
+            with open(dest, "rb") as f:
+                self.assertEqual(f.read(), b"abcdef")
+            self.assertEqual(progress_values, [100])
+
+    def test_download_file_resume_mismatch_overwrites(self):
+        # The If-Range validator does not match: the server ignores the Range and sends the whole file
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-length": "6", "last-modified": "Sun, 06 Nov 1994 08:49:37 GMT"}
+        mock_response.iter_content.return_value = [b"remote"]
+        self.mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as td:
+            dest = os.path.join(td, "file.bin")
+            with open(dest, "wb") as f:
+                f.write(b"stale")
+            result = download_file("http://example.com/file", dest, None, resume=True)
+
+            self.assertTrue(result.status)
+            with open(dest, "rb") as f:
+                self.assertEqual(f.read(), b"remote")
+            self.assertEqual(os.path.getmtime(dest), 784111777)
+
+    def test_download_file_skips_complete_file(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 416
+        mock_response.headers = {"content-range": "bytes */3"}
+        self.mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as td:
+            dest = os.path.join(td, "file.bin")
+            with open(dest, "wb") as f:
+                f.write(b"abc")
+            result = download_file("http://example.com/file", dest, None, resume=True)
+
+            self.assertTrue(result.status)
+            self.assertEqual(self.mock_get.call_count, 1)
+            mock_response.iter_content.assert_not_called()
+            with open(dest, "rb") as f:
+                self.assertEqual(f.read(), b"abc")
+
+    def test_download_file_without_content_length(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [b"abc"]
+        self.mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as td:
+            dest = os.path.join(td, "file.bin")
+            progress_values = []
+            result = download_file("http://example.com/file", dest, progress_values.append)
+
+            self.assertTrue(result.status)
+            self.assertEqual(progress_values, [])
+
+    def test_download_file_failure(self):
+        self.mock_get.side_effect = Exception("network error")
         with tempfile.TemporaryDirectory() as td:
             dest = os.path.join(td, "file.bin")
             result = download_file("http://example.com/file", dest, lambda p: None)
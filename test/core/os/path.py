@@ -1,4 +1,5 @@
 import os
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -25,6 +26,7 @@ from pylizlib.core.os.path import (
     get_home_dir,
     get_path_items,
     get_second_to_last_directory,
+    iter_path_items,
     random_subfolder,
     scan_directory_match_bool,
 )
@@ -263,6 +265,20 @@ class GetPathItemsTestCase(unittest.TestCase):
             self.assertEqual(len(items), 7)
 
 
+class IterPathItemsTestCase(unittest.TestCase):
+    def test_yields_lazily(self):
+        with tempfile.TemporaryDirectory() as td:
+            _build_tree(td)
+            iterator = iter_path_items(Path(td), recursive=True)
+            self.assertIsInstance(next(iterator), Path)
+            self.assertEqual(len(list(iterator)), 6)
+
+    def test_matches_get_path_items(self):
+        with tempfile.TemporaryDirectory() as td:
+            _build_tree(td)
+            self.assertEqual(sorted(iter_path_items(Path(td), recursive=True)), sorted(get_path_items(Path(td), recursive=True)))
+
+
 class ClearFolderContentsTestCase(unittest.TestCase):
     def test_clears_all(self):
         with tempfile.TemporaryDirectory() as td:
@@ -270,6 +286,15 @@ class ClearFolderContentsTestCase(unittest.TestCase):
             clear_folder_contents(Path(td))
             self.assertEqual(len(os.listdir(td)), 0)
 
+    @unittest.skipIf(sys.platform == "win32", "symlinks need privileges on Windows")
+    def test_unlinks_directory_symlink_without_touching_target(self):
+        with tempfile.TemporaryDirectory() as td, tempfile.TemporaryDirectory() as target:
+            Path(target, "keep.txt").write_text("keep")
+            os.symlink(target, os.path.join(td, "link"), target_is_directory=True)
+            clear_folder_contents(Path(td))
+            self.assertEqual(os.listdir(td), [])
+            self.assertTrue(Path(target, "keep.txt").exists())
+
     def test_not_a_dir_raises(self):
         with tempfile.NamedTemporaryFile() as tmp:
             with self.assertRaises(NotADirectoryError):
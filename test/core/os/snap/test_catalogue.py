@@ -4,7 +4,7 @@ Unit tests for pylizlib.core.os.snap.catalogue
 Covers every public method of SnapshotCatalogue:
     - __init__ (creates directory)
     - set_catalogue_path
-    - add / get_all / get_by_id / exists / get_snap_directory_path
+    - add / get_all / iter_all / list_ids / get_by_id / exists / get_snap_directory_path
     - delete (with and without backup)
     - install (content copy, date_last_used, backup trigger)
     - update_snapshot_by_objs / update_snapshot_by_edits (with backup trigger)
@@ -101,6 +101,58 @@ class TestSnapshotCatalogueCRUD(unittest.TestCase):
         self.assertEqual(retrieved.id, snap.id)
         self.assertIsNone(self.cat.get_by_id("nonexistent"))
 
+    def test_get_by_id_parses_only_target_snapshot(self):
+        snaps = [make_snapshot(f"CatSnapLookup{i}", self._src, n=1) for i in range(3)]
+        for snap in snaps:
+            self.cat.add(snap)
+        with patch.object(SnapshotSerializer, "from_json", wraps=SnapshotSerializer.from_json) as mock_from_json:
+            retrieved = self.cat.get_by_id(snaps[1].id)
+        self.assertEqual(retrieved.id, snaps[1].id)
+        mock_from_json.assert_called_once()
+
+    def test_iter_all_is_lazy(self):
+        for i in range(3):
+            self.cat.add(make_snapshot(f"CatSnapIter{i}", self._src, n=1))
+        with patch.object(SnapshotSerializer, "from_json", wraps=SnapshotSerializer.from_json) as mock_from_json:
+            iterator = self.cat.iter_all()
+            mock_from_json.assert_not_called()
+            first = next(iterator)
+            mock_from_json.assert_called_once()
+        self.assertIsInstance(first, Snapshot)
+        self.assertEqual(len(list(iterator)), 2)
+
+    def test_list_ids_does_not_parse_json(self):
+        snaps = [make_snapshot(f"CatSnapIds{i}", self._src, n=1) for i in range(2)]
+        for snap in snaps:
+            self.cat.add(snap)
+        with patch.object(SnapshotSerializer, "from_json") as mock_from_json:
+            ids = self.cat.list_ids()
+        mock_from_json.assert_not_called()
+        self.assertEqual(sorted(ids), sorted(s.id for s in snaps))
+
+    def test_scans_of_removed_catalogue_are_empty(self):
+        shutil.rmtree(CATALOGUE_PATH)
+        self.assertEqual(self.cat.get_all(), [])
+        self.assertEqual(self.cat.list_ids(), [])
+        self.assertFalse(CATALOGUE_PATH.exists())
+
+    def test_get_by_id_reparses_after_external_change(self):
+        snap = make_snapshot("CatSnapCacheExt", self._src, n=1)
+        self.cat.add(snap)
+        self.assertEqual(self.cat.get_by_id(snap.id).desc, snap.desc)
+        json_path = CATALOGUE_PATH / snap.folder_name / self.cat.settings.json_filename
+        SnapshotSerializer.update_field(json_path, "desc", "changed outside the catalogue")
+        self.assertEqual(self.cat.get_by_id(snap.id).desc, "changed outside the catalogue")
+
+    def test_get_by_id_returns_distinct_objects(self):
+        snap = make_snapshot("CatSnapCacheCopy", self._src, n=1)
+        self.cat.add(snap)
+        first = self.cat.get_by_id(snap.id)
+        second = self.cat.get_by_id(snap.id)
+        self.assertIsNot(first, second)
+        first.tags.append("edited-in-memory")
+        self.assertNotIn("edited-in-memory", self.cat.get_by_id(snap.id).tags)
+
     def test_add_multiple_snapshots(self):
         for i in range(3):
             self.cat.add(make_snapshot(f"Multi{i}", self._src, n=1))
@@ -208,6 +260,18 @@ class TestSnapshotCatalogueUpdate(unittest.TestCase):
         self.assertIn(src_sorted[2].as_posix(), paths)
         self.assertNotIn(src_sorted[0].as_posix(), paths)
 
+    def test_update_by_objs_copies_directory_added_to_loaded_snapshot(self):
+        src_sorted = sorted(self._src)
+        snap = make_snapshot("UpdateLoaded", src_sorted, n=1)
+        self.cat.add(snap)
+        old = self.cat.get_by_id(snap.id)
+        new = self.cat.get_by_id(snap.id)
+        added = SnapDirAssociation(index=99, original_path=str(src_sorted[2]), folder_id=gen_random_string(6))
+        new.directories.append(added)
+        self.cat.update_snapshot_by_objs(old, new)
+        self.assertTrue((CATALOGUE_PATH / snap.folder_name / added.directory_name).is_dir())
+        self.assertEqual(len(self.cat.get_by_id(snap.id).directories), 2)
+
 
 class TestSnapshotCatalogueDuplicate(unittest.TestCase):
     def setUp(self):
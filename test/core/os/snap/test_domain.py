@@ -13,6 +13,7 @@ Covers:
 import shutil
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -54,6 +55,18 @@ class TestSnapDirAssociationConstruction(unittest.TestCase):
         assoc = SnapDirAssociation(index=5, original_path=str(d), folder_id="abc")
         self.assertEqual(assoc.directory_name, "5-mydir")
 
+    def test_directory_name_follows_reassigned_path(self):
+        assoc = SnapDirAssociation(index=2, original_path="/dummy/first", folder_id="ra", mb_size=0.0)
+        assoc.original_path = "/dummy/second/"
+        self.assertEqual(assoc.directory_name, "2-second")
+
+    def test_directory_name_ignores_dot_and_repeated_separators(self):
+        assoc = SnapDirAssociation(index=3, original_path="/dummy/x", folder_id="dn", mb_size=0.0)
+        for path in ("/dummy/x/.", "/dummy/x//", "x/.", "x//"):
+            with self.subTest(path=path):
+                assoc.original_path = path
+                self.assertEqual(assoc.directory_name, "3-x")
+
     def test_original_path_normalised_to_posix(self):
         d = SOURCE_DATA_PATH / "normdir"
         d.mkdir()
@@ -100,6 +113,12 @@ class TestSnapDirAssociationConstruction(unittest.TestCase):
         i2 = SnapDirAssociation.next_index()
         self.assertEqual(i2, i1 + 1)
 
+    def test_next_index_is_unique_across_threads(self):
+        reset_index()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            indexes = list(executor.map(lambda _: SnapDirAssociation.next_index(), range(400)))
+        self.assertEqual(sorted(indexes), list(range(1, 401)))
+
 
 class TestSnapDirAssociationCopyInstallTo(unittest.TestCase):
     """Tests for SnapDirAssociation.copy_install_to."""
@@ -136,6 +155,61 @@ class TestSnapDirAssociationCopyInstallTo(unittest.TestCase):
         assoc.copy_install_to(target)
         self.assertTrue((target / assoc.directory_name).exists())
 
+    def test_copies_many_entries_concurrently_with_content(self):
+        src = SOURCE_DATA_PATH / "many"
+        src.mkdir()
+        for i in range(20):
+            (src / f"f{i}.txt").write_text(f"content {i}")
+        (src / "nested").mkdir()
+        (src / "nested" / "deep.txt").write_text("deep")
+
+        target = TEST_LOCAL_ROOT / "target_many"
+        assoc = SnapDirAssociation(index=1, original_path=str(src), folder_id="mn")
+        assoc.copy_install_to(target)
+
+        dest_dir = target / assoc.directory_name
+        for i in range(20):
+            self.assertEqual((dest_dir / f"f{i}.txt").read_text(), f"content {i}")
+        self.assertEqual((dest_dir / "nested" / "deep.txt").read_text(), "deep")
+
+    def test_empty_source_creates_empty_destination(self):
+        src = SOURCE_DATA_PATH / "empty"
+        src.mkdir()
+        target = TEST_LOCAL_ROOT / "target_empty"
+        assoc = SnapDirAssociation(index=1, original_path=str(src), folder_id="em")
+        assoc.copy_install_to(target)
+        self.assertEqual(list((target / assoc.directory_name).iterdir()), [])
+
+    def test_copy_error_is_propagated(self):
+        src = SOURCE_DATA_PATH / "conflict"
+        src.mkdir()
+        (src / "sub").mkdir()
+        target = TEST_LOCAL_ROOT / "target_conflict"
+        assoc = SnapDirAssociation(index=1, original_path=str(src), folder_id="cf")
+        (target / assoc.directory_name / "sub").mkdir(parents=True)
+        with self.assertRaises(FileExistsError):
+            assoc.copy_install_to(target)
+
+    def test_falls_back_to_copytree_without_cp(self):
+        src = SOURCE_DATA_PATH / "nocp"
+        (src / "nested").mkdir(parents=True)
+        (src / "nested" / "deep.txt").write_text("deep")
+        target = TEST_LOCAL_ROOT / "target_nocp"
+        assoc = SnapDirAssociation(index=1, original_path=str(src), folder_id="nc")
+        with patch("pylizlib.core.os.snap.domain._CP", None):
+            assoc.copy_install_to(target)
+        self.assertEqual((target / assoc.directory_name / "nested" / "deep.txt").read_text(), "deep")
+
+    def test_falls_back_to_copytree_when_cp_fails(self):
+        src = SOURCE_DATA_PATH / "cpfail"
+        (src / "nested").mkdir(parents=True)
+        (src / "nested" / "deep.txt").write_text("deep")
+        target = TEST_LOCAL_ROOT / "target_cpfail"
+        assoc = SnapDirAssociation(index=1, original_path=str(src), folder_id="cf2")
+        with patch("pylizlib.core.os.snap.domain._CP", "/nonexistent/cp"):
+            assoc.copy_install_to(target)
+        self.assertEqual((target / assoc.directory_name / "nested" / "deep.txt").read_text(), "deep")
+
 
 class TestSnapDirAssociationFactoryMethods(unittest.TestCase):
     """Tests for gen_random and gen_random_list factory methods."""
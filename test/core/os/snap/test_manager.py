@@ -127,6 +127,15 @@ class TestSnapshotManagerJsonUpdates(unittest.TestCase):
         self.assertEqual(loaded.tags, ["t1", "t2"])
         self.assertIsNotNone(loaded.date_modified)
 
+    def test_update_json_fields_use_one_batched_update_each(self):
+        snap = make_snapshot("SingleWrite", self._src, n=1)
+        mgr = self._mgr(snap)
+        mgr.create()
+        with patch.object(SnapshotSerializer, "update_fields", wraps=SnapshotSerializer.update_fields) as mock_update:
+            mgr.update_json_base_fields()
+            mgr.update_json_data_fields()
+        self.assertEqual(mock_update.call_count, 2)
+
     def test_update_json_data_fields(self):
         snap = make_snapshot("DataFields", self._src, n=1)
         mgr = self._mgr(snap)
@@ -137,6 +146,16 @@ class TestSnapshotManagerJsonUpdates(unittest.TestCase):
         self.assertEqual(loaded.data.get("env"), "prod")
         self.assertIsNotNone(loaded.date_last_modified)
 
+    def test_update_json_fields_store_same_timestamp_in_memory_and_on_disk(self):
+        snap = make_snapshot("SameTimestamp", self._src, n=1)
+        mgr = self._mgr(snap)
+        mgr.create()
+        mgr.update_json_base_fields()
+        mgr.update_json_data_fields()
+        loaded = SnapshotSerializer.from_json(mgr.path_snapshot_json)
+        self.assertEqual(loaded.date_modified, snap.date_modified)
+        self.assertEqual(loaded.date_last_modified, snap.date_last_modified)
+
 
 class TestSnapshotManagerDirectoryManagement(unittest.TestCase):
     def setUp(self):
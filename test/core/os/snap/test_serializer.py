@@ -6,18 +6,23 @@ Covers:
     - Correct handling of all optional datetime fields (None → preserved None)
     - BUG-3 regression: date_last_used survives serialisation
     - update_field for string, datetime, dict and list values
+    - update_fields batching several values into one write
+    - Atomic writes through a unique, fsynced temporary file and os.replace
     - JSON file written with UTF-8 encoding
     - _converter raises TypeError for unsupported types
 """
 
 import json
+import stat
+import threading
 import unittest
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from unittest.mock import patch
 
 from pylizlib.core.os.snap.domain import SnapDirAssociation, Snapshot
-from pylizlib.core.os.snap.serializer import SnapshotSerializer
+from pylizlib.core.os.snap.serializer import _SNAPSHOT_DATETIME_FIELDS, SnapshotSerializer
 from test.core.os.snap.conftest import (
     SOURCE_DATA_PATH,
     TEST_LOCAL_ROOT,
@@ -88,6 +93,30 @@ class TestSnapshotSerializerRoundTrip(unittest.TestCase):
         content = json_path.read_text(encoding="utf-8")
         self.assertIn("Descrizione", content)
 
+    def test_output_is_compact_unless_pretty(self):
+        src = list(SOURCE_DATA_PATH.iterdir())
+        snap = make_snapshot("PrettySnap", src, n=1)
+        compact_path = TEST_LOCAL_ROOT / "compact.json"
+        pretty_path = TEST_LOCAL_ROOT / "pretty.json"
+        SnapshotSerializer.to_json(snap, compact_path)
+        SnapshotSerializer.to_json(snap, pretty_path, pretty=True)
+        self.assertNotIn(b"\n", compact_path.read_bytes())
+        self.assertIn(b"\n  ", pretty_path.read_bytes())
+        self.assertEqual(json.loads(compact_path.read_bytes()), json.loads(pretty_path.read_bytes()))
+
+    def test_stdlib_fallback_round_trip(self):
+        src = list(SOURCE_DATA_PATH.iterdir())
+        snap = make_snapshot("FallbackSnap", src, n=2)
+        snap.date_last_used = datetime(2025, 6, 15, 12, 0, 0)
+        json_path = TEST_LOCAL_ROOT / "fallback.json"
+
+        with patch("pylizlib.core.data.json._orjson", None):
+            SnapshotSerializer.to_json(snap, json_path)
+            loaded = SnapshotSerializer.from_json(json_path)
+
+        self.assertEqual(loaded.date_last_used, snap.date_last_used)
+        self.assertEqual([d.folder_id for d in loaded.directories], [d.folder_id for d in snap.directories])
+
     def test_directories_deserialised_as_snap_dir_association(self):
         src = list(SOURCE_DATA_PATH.iterdir())
         snap = make_snapshot("DirDeser", src, n=2)
@@ -127,6 +156,16 @@ class TestSnapshotSerializerUpdateField(unittest.TestCase):
         loaded = SnapshotSerializer.from_json(json_path)
         self.assertEqual(loaded.date_last_used, new_ts)
 
+    def test_update_datetime_field_as_object(self):
+        snap, json_path = self._make_json("upd_dt_obj.json")
+        new_ts = datetime(2026, 1, 1, 8, 30, 0, 250)
+        SnapshotSerializer.update_field(json_path, "date_last_used", new_ts)
+        self.assertEqual(SnapshotSerializer.from_json(json_path).date_last_used, new_ts)
+
+        with patch("pylizlib.core.data.json._orjson", None):
+            SnapshotSerializer.update_field(json_path, "date_modified", new_ts)
+        self.assertEqual(SnapshotSerializer.from_json(json_path).date_modified, new_ts)
+
     def test_update_dict_field(self):
         snap, json_path = self._make_json("upd_dict.json")
         SnapshotSerializer.update_field(json_path, "data", {"env": "production"})
@@ -146,16 +185,85 @@ class TestSnapshotSerializerUpdateField(unittest.TestCase):
         loaded = SnapshotSerializer.from_json(json_path)
         self.assertEqual(loaded.desc, original_desc)
 
+    def test_update_fields_applies_all_values(self):
+        snap, json_path = self._make_json("upd_many.json")
+        SnapshotSerializer.update_fields(json_path, {"name": "Batch", "tags": ["a", "b"], "author": "Me"})
+        loaded = SnapshotSerializer.from_json(json_path)
+        self.assertEqual((loaded.name, loaded.tags, loaded.author), ("Batch", ["a", "b"], "Me"))
+        self.assertEqual(loaded.desc, snap.desc)
+
     def test_update_field_to_null(self):
         snap, json_path = self._make_json("upd_null.json")
         SnapshotSerializer.update_field(json_path, "date_modified", None)
         data = json.loads(json_path.read_text(encoding="utf-8"))
         self.assertIsNone(data["date_modified"])
 
+    def test_update_leaves_no_temporary_file(self):
+        snap, json_path = self._make_json("upd_atomic.json")
+        SnapshotSerializer.update_field(json_path, "name", "Atomic")
+        self.assertEqual(sorted(p.name for p in TEST_LOCAL_ROOT.glob("upd_atomic.json*")), ["upd_atomic.json"])
+
+    def test_failed_write_keeps_previous_content(self):
+        snap, json_path = self._make_json("upd_fail.json")
+        before = json_path.read_bytes()
+        with patch("pylizlib.core.os.snap.serializer.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                SnapshotSerializer.update_field(json_path, "name", "Never written")
+        self.assertEqual(json_path.read_bytes(), before)
+        self.assertEqual(list(TEST_LOCAL_ROOT.glob("upd_fail.json.*")), [])
+
+    def test_update_syncs_data_before_replacing(self):
+        snap, json_path = self._make_json("upd_sync.json")
+        calls = []
+        with (
+            patch("pylizlib.core.os.snap.serializer.os.fsync", side_effect=lambda fd: calls.append("fsync")),
+            patch("pylizlib.core.os.snap.serializer.os.replace", side_effect=lambda *a: calls.append("replace")),
+        ):
+            SnapshotSerializer.update_field(json_path, "name", "Synced")
+        self.assertEqual(calls, ["fsync", "replace"])
+
+    def test_update_keeps_file_mode(self):
+        snap, json_path = self._make_json("upd_mode.json")
+        json_path.chmod(0o640)
+        SnapshotSerializer.update_field(json_path, "name", "Mode")
+        self.assertEqual(stat.S_IMODE(json_path.stat().st_mode), 0o640)
+
+    def test_new_file_gets_default_mode(self):
+        reference = TEST_LOCAL_ROOT / "mode_reference.json"
+        reference.write_bytes(b"{}")
+        snap, json_path = self._make_json("new_mode.json")
+        self.assertEqual(stat.S_IMODE(json_path.stat().st_mode), stat.S_IMODE(reference.stat().st_mode))
+
+    def test_concurrent_updates_use_distinct_temporary_files(self):
+        snap, json_path = self._make_json("upd_concurrent.json")
+        errors = []
+
+        def worker(i):
+            try:
+                for j in range(10):
+                    SnapshotSerializer.update_field(json_path, "desc", f"writer {i} pass {j}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertTrue(SnapshotSerializer.from_json(json_path).desc.startswith("writer "))
+        self.assertEqual(sorted(p.name for p in TEST_LOCAL_ROOT.glob("upd_concurrent.json*")), ["upd_concurrent.json"])
+
 
 class TestSnapshotSerializerConverter(unittest.TestCase):
     """Tests for the internal JSON type converter."""
 
+    def test_datetime_fields_derived_from_snapshot(self):
+        self.assertEqual(
+            _SNAPSHOT_DATETIME_FIELDS,
+            ("date_created", "date_modified", "date_last_used", "date_last_modified"),
+        )
+
     def test_converter_raises_for_unsupported_type(self):
         with self.assertRaises(TypeError):
             SnapshotSerializer._converter(object())
@@ -166,6 +274,11 @@ class TestSnapshotSerializerConverter(unittest.TestCase):
         self.assertIsInstance(result, str)
         self.assertIn("2026", result)
 
+    def test_converter_maps_dataclass_fields_shallowly(self):
+        assoc = SnapDirAssociation(index=1, original_path="/tmp/x", folder_id="abc", mb_size=1.5)
+        result = SnapshotSerializer._converter(assoc)
+        self.assertEqual(result, {"index": 1, "original_path": "/tmp/x", "folder_id": "abc", "mb_size": 1.5})
+
     def test_converter_handles_enum(self):
         class DummyEnum(Enum):
             FOO = "bar"
@@ -5,7 +5,7 @@ import stat
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from pylizlib.core.os.utils import (
     check_move_dirs_free_space,
@@ -18,6 +18,7 @@ from pylizlib.core.os.utils import (
     is_os_unix,
     is_os_windows,
     is_software_installed,
+    iter_tree_files,
     open_system_folder,
 )
 
@@ -35,6 +36,58 @@ class GetFolderSizeMbTestCase(unittest.TestCase):
         with tempfile.TemporaryDirectory() as td:
             self.assertEqual(get_folder_size_mb(td), 0.0)
 
+    def test_nested_folders_are_included(self):
+        with tempfile.TemporaryDirectory() as td:
+            nested = os.path.join(td, "a", "b")
+            os.makedirs(nested)
+            with open(os.path.join(td, "top.bin"), "wb") as f:
+                f.write(b"x" * 1024)
+            with open(os.path.join(nested, "deep.bin"), "wb") as f:
+                f.write(b"x" * 1024)
+            self.assertEqual(get_folder_size_mb(td), 2048 / (1024 * 1024))
+
+    def test_unreadable_subdirectory_is_skipped(self):
+        with tempfile.TemporaryDirectory() as td:
+            locked = os.path.join(td, "locked")
+            os.makedirs(locked)
+            with open(os.path.join(td, "top.bin"), "wb") as f:
+                f.write(b"x" * 1024)
+            with open(os.path.join(locked, "hidden.bin"), "wb") as f:
+                f.write(b"x" * 1024)
+            real_scandir = os.scandir
+
+            def scandir(path):
+                if os.fspath(path) == locked:
+                    raise PermissionError(path)
+                return real_scandir(path)
+
+            with patch("pylizlib.core.os.utils.os.scandir", side_effect=scandir):
+                self.assertEqual(get_folder_size_mb(td), 1024 / (1024 * 1024))
+
+    def test_stat_error_is_skipped(self):
+        with tempfile.TemporaryDirectory() as td:
+            with open(os.path.join(td, "top.bin"), "wb") as f:
+                f.write(b"x" * 1024)
+            entry = MagicMock()
+            entry.is_dir.return_value = False
+            entry.stat.side_effect = FileNotFoundError("gone")
+            with patch("pylizlib.core.os.utils.iter_tree_files", return_value=[entry]):
+                self.assertEqual(get_folder_size_mb(td), 0.0)
+
+
+class IterTreeFilesTestCase(unittest.TestCase):
+    def test_non_recursive_skips_subdirectories(self):
+        with tempfile.TemporaryDirectory() as td:
+            os.makedirs(os.path.join(td, "sub"))
+            Path(td, "a.txt").write_text("a")
+            Path(td, "sub", "b.txt").write_text("b")
+            self.assertEqual([e.name for e in iter_tree_files(td, recursive=False)], ["a.txt"])
+            self.assertEqual(sorted(e.name for e in iter_tree_files(td)), ["a.txt", "b.txt"])
+
+    def test_missing_directory_yields_nothing(self):
+        with tempfile.TemporaryDirectory() as td:
+            self.assertEqual(list(iter_tree_files(os.path.join(td, "missing"))), [])
+
 
 class GetDirectorySizeTestCase(unittest.TestCase):
     def test_known_size(self):
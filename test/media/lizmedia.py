@@ -1,11 +1,14 @@
 import json
+import os
+import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, PropertyMock, mock_open, patch
 
 from pylizlib.core.domain.os import FileType
+from pylizlib.core.os.file import get_file_c_date
 from pylizlib.media.lizmedia import LizMedia, LizMediaSearchResult, MediaListResult, MediaStatus
 
 
@@ -40,8 +43,9 @@ class TestLizMedia(unittest.TestCase):
         self.assertEqual(media.extension, ".jpg")
 
     @patch("pylizlib.media.lizmedia.is_media_file", return_value=True)
-    @patch("pylizlib.media.lizmedia.get_file_c_date")
-    def test_creation_time(self, mock_get_date, _):
+    @patch("pylizlib.media.lizmedia.get_stat_c_date")
+    @patch.object(LizMedia, "_stat", new_callable=PropertyMock)
+    def test_creation_time(self, _, mock_get_date, __):
         dt = datetime(2023, 1, 1, 12, 0, 0)
         mock_get_date.return_value = dt
         media = LizMedia(self.mock_path)
@@ -53,9 +57,9 @@ class TestLizMedia(unittest.TestCase):
         self.assertEqual(media.day, 1)
 
     @patch("pylizlib.media.lizmedia.is_media_file", return_value=True)
-    @patch("os.path.getsize")
-    def test_size(self, mock_getsize, _):
-        mock_getsize.return_value = 1000000  # 1 MB decimal
+    @patch.object(LizMedia, "_stat", new_callable=PropertyMock)
+    def test_size(self, mock_stat, _):
+        mock_stat.return_value = SimpleNamespace(st_size=1000000)  # 1 MB decimal
         media = LizMedia(self.mock_path)
 
         self.assertEqual(media.size_byte, 1000000)
@@ -64,16 +68,54 @@ class TestLizMedia(unittest.TestCase):
     @patch("pylizlib.media.lizmedia.is_media_file", return_value=True)
     @patch("pylizlib.media.lizmedia.get_file_type")
     def test_type_checks(self, mock_get_type, _):
-        media = LizMedia(self.mock_path)
-
         mock_get_type.return_value = FileType.IMAGE
+        media = LizMedia(self.mock_path)
         self.assertTrue(media.is_image)
         self.assertFalse(media.is_video)
 
         mock_get_type.return_value = FileType.VIDEO
+        media = LizMedia(self.mock_video_path)
         self.assertTrue(media.is_video)
         self.assertFalse(media.is_image)
 
+    def test_reassigning_path_clears_cached_values(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_path = Path(temp_dir) / "image.jpg"
+            image_path.write_bytes(b"x" * 2048)
+            video_path = Path(temp_dir) / "clip.mp4"
+            video_path.write_bytes(b"x" * 1024)
+
+            media = LizMedia(image_path)
+            self.assertEqual(media.size_byte, 2048)
+            self.assertTrue(media.is_image)
+
+            media.path = video_path
+            self.assertEqual(media.size_byte, 1024)
+            self.assertTrue(media.is_video)
+
+    @patch("pylizlib.media.lizmedia.get_file_type", return_value=FileType.IMAGE)
+    def test_file_attributes_share_one_cached_stat(self, mock_get_type):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_path = Path(temp_dir) / "image.jpg"
+            image_path.write_bytes(b"x" * 2048)
+            expected_date = get_file_c_date(str(image_path))
+
+            with patch("pylizlib.media.lizmedia.os.stat", wraps=os.stat) as mock_stat:
+                media = LizMedia(image_path)
+                mock_get_type.assert_not_called()
+                mock_stat.assert_not_called()
+
+                for _ in range(3):
+                    self.assertTrue(media.is_image)
+                    self.assertFalse(media.is_audio)
+                    self.assertEqual(media.creation_time, expected_date)
+                    self.assertEqual(media.year, expected_date.year)
+                    self.assertEqual(media.size_byte, 2048)
+                    self.assertEqual(media.size_mb, 0.002048)
+
+            mock_get_type.assert_called_once()
+            mock_stat.assert_called_once_with(image_path)
+
     @patch("pylizlib.media.lizmedia.is_media_file", return_value=True)
     @patch("pylizlib.media.lizmedia.get_file_type", return_value=FileType.IMAGE)
     @patch("pylizlib.media.lizmedia.ParserManager")
@@ -88,6 +130,7 @@ class TestLizMedia(unittest.TestCase):
 
         # Test not found
         mock_instance.parse.return_value = None
+        media = LizMedia(self.mock_path)
         self.assertIsNone(media.stable_diffusion_metadata)
         self.assertFalse(media.ai_generated)
 
@@ -204,8 +247,8 @@ class TestLizMedia(unittest.TestCase):
     @patch("pylizlib.media.lizmedia.exifread.process_file", return_value={})
     @patch("pylizlib.media.lizmedia.MetadataHandler")
     @patch("pylizlib.media.lizmedia.ParserManager")
-    @patch("os.path.getsize", return_value=2500000)
-    @patch("pylizlib.media.lizmedia.get_file_c_date")
+    @patch.object(LizMedia, "_stat", new_callable=PropertyMock, return_value=SimpleNamespace(st_size=2500000))
+    @patch("pylizlib.media.lizmedia.get_stat_c_date")
     @patch("pylizlib.media.lizmedia.get_file_type", return_value=FileType.IMAGE)
     @patch("pylizlib.media.lizmedia.is_media_file", return_value=True)
     def test_to_json_serializes_full_media_payload(
@@ -279,8 +322,8 @@ class TestLizMedia(unittest.TestCase):
         self.assertTrue(payload["ai_scanned"])
         self.assertFalse(payload["ai_nsfw"])
 
-    @patch("os.path.getsize", return_value=4096)
-    @patch("pylizlib.media.lizmedia.get_file_c_date")
+    @patch.object(LizMedia, "_stat", new_callable=PropertyMock, return_value=SimpleNamespace(st_size=4096))
+    @patch("pylizlib.media.lizmedia.get_stat_c_date")
     @patch("pylizlib.media.lizmedia.get_file_type", return_value=FileType.AUDIO)
     @patch("pylizlib.media.lizmedia.is_media_file", return_value=True)
     def test_to_json_uses_null_for_unavailable_media_values(self, _, __, mock_get_date, ___):
@@ -315,6 +358,44 @@ class TestLizMedia(unittest.TestCase):
         self.assertFalse(payload["ai_scanned"])
         self.assertIsNone(payload["ai_nsfw"])
 
+    @patch.object(LizMedia, "_stat", new_callable=PropertyMock, return_value=SimpleNamespace(st_size=4096))
+    @patch("pylizlib.media.lizmedia.get_stat_c_date", return_value=datetime(2025, 6, 7, 8, 9, 10))
+    @patch("pylizlib.media.lizmedia.get_file_type", return_value=FileType.VIDEO)
+    @patch("pylizlib.media.lizmedia.is_media_file", return_value=True)
+    @patch("pylizlib.media.lizmedia.VideoUtils")
+    def test_to_dict_resolves_derived_values_once(self, mock_video_utils, _, mock_get_type, mock_get_date, __):
+        mock_video_utils.get_video_duration_seconds.return_value = 120.0
+        mock_video_utils.get_video_frame_rate.return_value = 30.0
+        mock_video_utils.get_video_creation_date.return_value = None
+
+        payload = LizMedia(Path("/path/to/test_video.mp4")).to_dict()
+
+        self.assertEqual(payload["year"], 2025)
+        self.assertEqual(payload["size_mb"], 0.004096)
+        self.assertTrue(payload["is_video"])
+        self.assertEqual(payload["duration_sec"], 120.0)
+        self.assertEqual(payload["duration_min"], 2.0)
+        self.assertEqual(payload["frame_rate"], 30.0)
+        mock_video_utils.get_video_duration_seconds.assert_called_once()
+        mock_video_utils.get_video_frame_rate.assert_called_once()
+        mock_get_date.assert_called_once()
+
+    @patch("pylizlib.media.lizmedia.get_file_type", return_value=FileType.VIDEO)
+    @patch("pylizlib.media.lizmedia.is_media_file", return_value=True)
+    @patch("pylizlib.media.lizmedia.VideoUtils")
+    def test_to_dict_reads_video_properties(self, mock_video_utils, _, __):
+        media = LizMedia(Path("/path/to/test_video.mp4"))
+        media.__dict__["duration_sec"] = 90.0
+        media.__dict__["frame_rate"] = 24.0
+
+        payload = media.to_dict()
+
+        self.assertEqual(payload["duration_sec"], 90.0)
+        self.assertEqual(payload["duration_min"], 1.5)
+        self.assertEqual(payload["frame_rate"], 24.0)
+        mock_video_utils.get_video_duration_seconds.assert_not_called()
+        mock_video_utils.get_video_frame_rate.assert_not_called()
+
 
 class TestLizMediaSearchResult(unittest.TestCase):
     def test_initialization_and_properties(self):
@@ -337,6 +418,12 @@ class TestLizMediaSearchResult(unittest.TestCase):
         self.assertTrue(res3.has_lizmedia())
         self.assertTrue(res3.has_sidecars())
 
+    def test_uses_slots(self):
+        res = LizMediaSearchResult(MediaStatus.ACCEPTED, Path("p1"))
+
+        self.assertFalse(hasattr(res, "__dict__"))
+        self.assertFalse(hasattr(MediaListResult(), "__dict__"))
+
 
 class TestMediaListResult(unittest.TestCase):
     def test_total_count(self):
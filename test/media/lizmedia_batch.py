@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from pylizlib.core.os.file import get_file_c_date
+from pylizlib.media.lizmedia import LizMedia
+from pylizlib.media.lizmedia_batch import LizMediaBatch
+
+
+class TestLizMediaBatch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="pyliz_media_batch_")
+        self.root = Path(self.temp_dir.name)
+        (self.root / "photo.jpg").write_bytes(b"x" * 10)
+        (self.root / "clip.mp4").write_bytes(b"x" * 2000)
+        (self.root / "song.mp3").write_bytes(b"x" * 30)
+        (self.root / "notes.txt").write_bytes(b"ignored")
+        (self.root / "nested").mkdir()
+        (self.root / "nested" / "inner.png").write_bytes(b"x" * 5)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _by_name(self, batch: LizMediaBatch) -> dict:
+        return {os.path.basename(path): index for index, path in enumerate(batch.paths)}
+
+    def test_from_dir_collects_media_columns(self):
+        batch = LizMediaBatch.from_dir(self.root)
+
+        rows = self._by_name(batch)
+        self.assertEqual(set(rows), {"photo.jpg", "clip.mp4", "song.mp3"})
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.sizes.dtype, np.int64)
+        self.assertEqual(batch.sizes[rows["clip.mp4"]], 2000)
+        self.assertTrue(batch.is_image[rows["photo.jpg"]])
+        self.assertTrue(batch.is_video[rows["clip.mp4"]])
+        self.assertTrue(batch.is_audio[rows["song.mp3"]])
+        self.assertEqual(int(batch.is_image.sum() + batch.is_video.sum() + batch.is_audio.sum()), 3)
+        expected_date = get_file_c_date(str(self.root / "photo.jpg"))
+        self.assertAlmostEqual(batch.creation_times[rows["photo.jpg"]], expected_date.timestamp(), places=5)
+
+    def test_from_dir_recursive(self):
+        batch = LizMediaBatch.from_dir(self.root, recursive=True)
+        self.assertIn("inner.png", self._by_name(batch))
+        self.assertEqual(len(batch), 4)
+
+    def test_select_and_to_media_list(self):
+        batch = LizMediaBatch.from_dir(self.root)
+
+        large_videos = batch.select(batch.is_video & (batch.sizes > 1000))
+        self.assertEqual(len(large_videos), 1)
+        media = large_videos.to_media_list()
+        self.assertIsInstance(media[0], LizMedia)
+        self.assertEqual(media[0].file_name, "clip.mp4")
+
+    def test_from_paths_keeps_order_and_rejects_non_media(self):
+        batch = LizMediaBatch.from_paths([self.root / "song.mp3", self.root / "photo.jpg"])
+        self.assertEqual([os.path.basename(path) for path in batch.paths], ["song.mp3", "photo.jpg"])
+
+        with self.assertRaises(ValueError):
+            LizMediaBatch.from_paths([self.root / "notes.txt"])
+
+    def test_from_dir_skips_unreadable_subdirectory(self):
+        nested = str(self.root / "nested")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == nested:
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        with patch("pylizlib.core.os.utils.os.scandir", side_effect=scandir):
+            batch = LizMediaBatch.from_dir(self.root, recursive=True)
+        self.assertEqual(set(self._by_name(batch)), {"photo.jpg", "clip.mp4", "song.mp3"})
+
+    def test_equality_is_identity(self):
+        batch = LizMediaBatch.from_dir(self.root)
+        self.assertEqual(batch, batch)
+        self.assertNotEqual(batch, LizMediaBatch.from_dir(self.root))
+
+    def test_empty_directory(self):
+        with tempfile.TemporaryDirectory() as empty_dir:
+            batch = LizMediaBatch.from_dir(empty_dir)
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.to_media_list(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+import unittest
+
+import pylizlib.media
+
+
+class MediaAppTestCase(unittest.TestCase):
+    def test_import_does_not_load_typer(self):
+        code = "import sys, pylizlib.media.lizmedia; sys.exit('typer' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code])
+        self.assertEqual(result.returncode, 0)
+
+    def test_app_is_built_once(self):
+        import typer
+
+        app = pylizlib.media.pyliz_media
+        self.assertIsInstance(app, typer.Typer)
+        self.assertIs(pylizlib.media.pyliz_media, app)
+
+    def test_unknown_attribute_raises(self):
+        with self.assertRaises(AttributeError):
+            pylizlib.media.not_a_member
+
+
+if __name__ == "__main__":
+    unittest.main()
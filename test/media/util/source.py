@@ -2,6 +2,7 @@ import base64
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from PIL import Image
 
@@ -26,6 +27,12 @@ class TestMediaSourceUtils(unittest.TestCase):
         self.assertFalse(source.is_temporary)
         self.assertIsNone(source.base64_content)
 
+    def test_resolve_media_source_rejects_missing_path_and_directory(self):
+        with self.assertRaises(FileNotFoundError):
+            resolve_media_source(media_path=Path(self.temp_dir.name) / "missing.png")
+        with self.assertRaises(FileNotFoundError):
+            resolve_media_source(media_path=self.temp_dir.name)
+
     def test_resolve_media_source_from_data_uri(self):
         payload = base64.b64encode(self.image_path.read_bytes()).decode("utf-8")
         source = resolve_media_source(base64_content=f"data:image/png;base64,{payload}")
@@ -41,6 +48,19 @@ class TestMediaSourceUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             resolve_media_source(base64_content=payload)
 
+    def test_resolve_media_source_rejects_invalid_base64(self):
+        with self.assertRaises(ValueError):
+            resolve_media_source(base64_content="not base64!!", file_name="x.png")
+
+    def test_resolve_media_source_falls_back_to_stdlib_base64(self):
+        payload = base64.b64encode(self.image_path.read_bytes()).decode("utf-8")
+        with patch("pylizlib.core.data.b64._pybase64", None):
+            source = resolve_media_source(base64_content=payload, file_name="image.png")
+        try:
+            self.assertEqual(source.path.read_bytes(), self.image_path.read_bytes())
+        finally:
+            source.path.unlink(missing_ok=True)
+
 
 if __name__ == "__main__":
     unittest.main()